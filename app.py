@@ -18,6 +18,9 @@ app = Flask(
 
 app.config["SECRET_KEY"] = "tatvax-enhanced-secret-key-2025"
 
+# Worker processes for CPU-bound answer summarization (0 runs it inline)
+app.config["CPU_WORKERS"] = int(os.environ.get("TATVAX_CPU_WORKERS", "2"))
+
 # Global instances
 translation_service = None
 content_manager = None
@@ -48,7 +51,8 @@ def initialize_services():
         print("✅ Translation service initialized")
 
         # Initialize content manager
-        content_manager = ContentManager()
+        content_manager = ContentManager(cpu_workers=app.config["CPU_WORKERS"])
+        content_manager.start_watcher()
         print("✅ Content manager initialized")
 
         # Initialize enhanced chatbot helper
@@ -69,9 +73,18 @@ def process_user_input(text, input_type="text", selected_language="en"):
         detected_lang = translation_service.detect_language(text)
         print(f"🔍 Input language detected: {detected_lang}")
 
-        # Translate to English for processing if needed
+        # Translate to English for processing if needed, unless the query's
+        # words are already known to the content index
         if detected_lang != "en":
-            english_query = translation_service.translate_text(text, target_lang="en")
+            english_query = content_manager.translate_native_query(text)
+            if english_query:
+                print(
+                    f"⚡ Native-script retrieval, no translation needed: {english_query}"
+                )
+            else:
+                english_query = translation_service.translate_text(
+                    text, target_lang="en"
+                )
         else:
             english_query = text
 
@@ -240,6 +253,43 @@ def get_subjects():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/subjects/<path:subject>/chapters")
+def get_subject_chapters(subject):
+    """Get the chapter and section outline of a subject"""
+    try:
+        if not content_manager:
+            return jsonify({"error": "Content manager not initialized"}), 500
+
+        chapters = content_manager.get_document_outline(subject)
+        if chapters is None or subject not in content_manager.subjects:
+            return jsonify({"error": f"Subject '{subject}' not found"}), 404
+
+        return jsonify({"status": "success", "subject": subject, "chapters": chapters})
+    except Exception as e:
+        print(f"❌ Error getting chapters: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/subjects/<path:subject>/sections/<int:section_id>")
+def get_subject_section(subject, section_id):
+    """Get one section of a subject by id"""
+    try:
+        if not content_manager:
+            return jsonify({"error": "Content manager not initialized"}), 500
+
+        if subject not in content_manager.subjects:
+            return jsonify({"error": f"Subject '{subject}' not found"}), 404
+
+        section = content_manager.get_section(subject, section_id)
+        if section is None:
+            return jsonify({"error": f"Section {section_id} not found"}), 404
+
+        return jsonify({"status": "success", "subject": subject, "section": section})
+    except Exception as e:
+        print(f"❌ Error getting section: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/api/languages")
 def get_languages():
     """Get supported languages"""
@@ -444,6 +494,9 @@ def get_status():
             "audio_playing": (
                 chatbot_helper.is_audio_playing() if chatbot_helper else False
             ),
+            "query_cache": (
+                content_manager.query_cache.get_stats() if content_manager else {}
+            ),
             "version": "3.0.0 - Enhanced Edition",
         }
         return jsonify(status)
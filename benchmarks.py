@@ -0,0 +1,325 @@
+import argparse
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from content_index import split_sentences, tokenize
+from cpu_pool import CPUTaskPool
+from keyword_matcher import KeywordAutomaton
+from lexrank import (
+    MIN_SENTENCE_TERMS,
+    SIMILARITY_THRESHOLD,
+    sentence_idf,
+    summarize,
+    term_counts,
+)
+
+# Run in a fresh interpreter so nothing is imported before the clock starts
+STARTUP_PROBE = """
+import sys, time
+started = time.perf_counter()
+import chatbot_helpers
+imported = time.perf_counter()
+chatbot_helpers.EnhancedChatbotHelpers()
+ready = time.perf_counter()
+loaded = [m for m in ("pygame", "speech_recognition", "gtts", "nltk", "sumy") if m in sys.modules]
+print("STARTUP", (imported - started) * 1000, (ready - imported) * 1000, ",".join(loaded))
+"""
+
+
+def bench_startup():
+    """Import and construction time of the chatbot helpers in a fresh interpreter"""
+    timings = []
+    for _ in range(5):
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+        )
+        line = [
+            output
+            for output in result.stdout.splitlines()
+            if output.startswith("STARTUP")
+        ][-1]
+        _, import_ms, init_ms, loaded = (line.split(" ") + [""])[:4]
+        timings.append((float(import_ms), float(init_ms)))
+
+    import_ms = min(t[0] for t in timings)
+    init_ms = min(t[1] for t in timings)
+    print(
+        f"⏱️ import chatbot_helpers: {import_ms:.0f} ms, "
+        f"EnhancedChatbotHelpers(): {init_ms:.0f} ms (best of {len(timings)})"
+    )
+    print(f"📦 Audio/NLP modules loaded at startup: {loaded or 'none'}")
+
+
+def bench_lexrank():
+    """Time the LexRank summarizers and compare their picks with sumy's"""
+    from content_manager import ContentManager
+
+    try:
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.parsers.plaintext import PlaintextParser
+        from sumy.summarizers.lex_rank import LexRankSummarizer
+
+        SUMY_AVAILABLE = True
+    except ImportError:
+        SUMY_AVAILABLE = False
+
+    manager = ContentManager(use_pack=False)
+    samples = []  # (document, passage ids, text) of every answer-sized window
+    for key in manager.get_document_keys():
+        document = manager.get_document(key)
+        for start in range(0, len(document.display) - 2, 3):
+            ids = list(range(start, start + 3))
+            text = "\n\n".join(document.display[i] for i in ids)
+            if len(text) > 500:
+                samples.append((document, ids, text))
+    print(f"📚 {len(samples)} passage windows over 500 characters")
+
+    def index_lexrank(document, ids, text):
+        sentences = [entry for i in ids for entry in document.get_sentences(i)]
+        chosen = summarize([counts for _, counts, _ in sentences])
+        return [sentences[i][0] for i in chosen]
+
+    def text_lexrank(document, ids, text):
+        sentences = split_sentences(text)
+        return [sentences[i] for i in summarize([term_counts(s) for s in sentences])]
+
+    def loop_lexrank(document, ids, text):
+        # sumy's LexRankSummarizer algorithm as its plain-Python loops
+        sentences = split_sentences(text)
+        vectors = [term_counts(s) for s in sentences]
+        candidates = [
+            i for i, v in enumerate(vectors) if sum(v.values()) >= MIN_SENTENCE_TERMS
+        ]
+        if len(candidates) <= 3:
+            return [sentences[i] for i in candidates]
+        vectors = [vectors[i] for i in candidates]
+        idf = sentence_idf(vectors)
+        tf = [{t: c / max(v.values()) for t, c in v.items()} for v in vectors]
+        size = len(vectors)
+        matrix = [[0.0] * size for _ in range(size)]
+        for row in range(size):
+            for col in range(size):
+                numerator = sum(
+                    tf[row][t] * tf[col][t] * idf[t] ** 2
+                    for t in tf[row].keys() & tf[col].keys()
+                )
+                first = sum((tf[row][t] * idf[t]) ** 2 for t in tf[row])
+                second = sum((tf[col][t] * idf[t]) ** 2 for t in tf[col])
+                if first > 0 and second > 0:
+                    similarity = numerator / (math.sqrt(first) * math.sqrt(second))
+                    matrix[row][col] = float(similarity > SIMILARITY_THRESHOLD)
+            degree = sum(matrix[row]) or 1.0
+            matrix[row] = [value / degree for value in matrix[row]]
+        scores = [1.0 / size] * size
+        for _ in range(100):
+            updated = [
+                sum(matrix[row][col] * scores[row] for row in range(size))
+                for col in range(size)
+            ]
+            change = math.sqrt(sum((a - b) ** 2 for a, b in zip(updated, scores)))
+            scores = updated
+            if change < 1e-4:
+                break
+        best = sorted(sorted(range(size), key=lambda i: -scores[i])[:3])
+        return [sentences[candidates[i]] for i in best]
+
+    methods = {
+        "numpy, cached sentences": index_lexrank,
+        "numpy, sentence IDF": text_lexrank,
+        "python loops, sentence IDF": loop_lexrank,
+    }
+    if SUMY_AVAILABLE:
+        sumy_summarizer = LexRankSummarizer()
+
+        def sumy_lexrank(document, ids, text):
+            parser = PlaintextParser.from_string(text, Tokenizer("english"))
+            return [str(s) for s in sumy_summarizer(parser.document, 3)]
+
+        methods["sumy LexRankSummarizer"] = sumy_lexrank
+    else:
+        print("⚠️ sumy not installed, timing the NumPy summarizer only")
+
+    results = {}
+    for name, method in methods.items():
+        started = time.perf_counter()
+        results[name] = [method(*sample) for sample in samples]
+        elapsed = time.perf_counter() - started
+        print(f"⏱️ {name}: {elapsed / max(1, len(samples)) * 1000:.2f} ms per summary")
+
+    # Sentence splitting differs between tokenizers, so compare by terms
+    def agreement(ours: List[List[str]], theirs: List[List[str]]) -> float:
+        matched = total = 0
+        for mine, other in zip(ours, theirs):
+            other_terms = [set(tokenize(s)) for s in other]
+            for sentence in mine:
+                terms = set(tokenize(sentence))
+                total += 1
+                matched += any(
+                    terms <= candidate or candidate <= terms
+                    for candidate in other_terms
+                )
+        return matched / total if total else 1.0
+
+    reference = (
+        "sumy LexRankSummarizer" if SUMY_AVAILABLE else "python loops, sentence IDF"
+    )
+    for name in methods:
+        if name != reference:
+            print(
+                f"🎯 {name} vs {reference}: "
+                f"{agreement(results[name], results[reference]):.0%} of top-3 sentences shared"
+            )
+
+
+def bench_keywords():
+    """Time keyword matching by substring loop against the automaton"""
+    from chatbot_helpers import EnhancedChatbotHelpers
+
+    helper = EnhancedChatbotHelpers()
+    keywords = {"institutional": helper.institutional_keywords}
+    keywords.update(helper.subject_keywords)
+    queries = [
+        "What is the fee structure for class 6?",
+        "Explain photosynthesis in plants",
+        "How do I use a ruler to measure an angle?",
+        "When is the syllabus for the final exam released?",
+        "Tell me about the history of ancient India and its culture",
+        "प्रकाश संश्लेषण क्या है",
+        "स्कूल की फीस कितनी है",
+        "What are nouns and verbs in English grammar with examples from the story?",
+        # Derived forms, listed as keywords of their own
+        "When are the examinations?",
+        "Practice mathematical operations",
+        "Safety rules in the laboratory",
+    ]
+
+    def substring_loop(query: str) -> Dict[str, int]:
+        query_lower = query.lower()
+        return {
+            label: sum(1 for keyword in words if keyword in query_lower)
+            for label, words in keywords.items()
+        }
+
+    started = time.perf_counter()
+    automaton = KeywordAutomaton(keywords)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rounds = 2000
+    timings = {}
+    for name, match in (
+        ("substring loop", substring_loop),
+        ("automaton", automaton.count),
+    ):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for query in queries:
+                match(query)
+        timings[name] = (time.perf_counter() - started) / (rounds * len(queries)) * 1e6
+
+    print(
+        f"🔎 {len(automaton.keywords)} keywords, automaton built in {build_ms:.1f} ms"
+    )
+    for name, microseconds in timings.items():
+        print(f"⏱️ {name}: {microseconds:.1f} µs per query")
+    for query in queries:
+        old = {k: v for k, v in substring_loop(query).items() if v}
+        new = {k: v for k, v in automaton.count(query).items() if v}
+        matched = sorted(automaton.keywords[i][0] for i in automaton.find(query))
+        print(f"   {query!r}: loop {old} -> automaton {new} {matched}")
+
+
+def _spin(seconds: float) -> int:
+    # Pure-Python busy loop that holds the GIL, standing in for a long summary
+    deadline = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < deadline:
+        count += 1
+    return count
+
+
+def bench_cpu_pool():
+    """Latency of light work while heavy tasks run inline or in the pool"""
+    # Latency of a short task on one thread while other threads run long,
+    # GIL-bound tasks: inline they stall it, in the pool they do not
+    for workers in (0, 2):
+        pool = CPUTaskPool(workers=workers, timeout=5.0)
+        pool.run(_spin, 0.0)  # Start the workers outside the measurement
+
+        heavy = [threading.Thread(target=pool.run, args=(_spin, 0.5)) for _ in range(2)]
+        for thread in heavy:
+            thread.start()
+        time.sleep(0.05)
+
+        # A light request: short CPU slices between blocking I/O, each of
+        # which has to win the GIL back from the heavy threads
+        started = time.perf_counter()
+        for _ in range(20):
+            sum(range(2000))
+            time.sleep(0.001)
+        light_ms = (time.perf_counter() - started) * 1000
+
+        for thread in heavy:
+            thread.join()
+        pool.shutdown()
+        print(
+            f"⏱️ {workers} workers: light work took {light_ms:.1f} ms "
+            f"during heavy tasks ({pool.get_stats()})"
+        )
+
+
+def bench_postings():
+    """Memory of the compact postings against tuple lists"""
+    from content_manager import ContentManager
+
+    manager = ContentManager(use_pack=False, memory_budget_mb=4096)
+    for key in manager.get_document_keys():
+        manager.get_document(key)
+    report = manager.get_memory_report()
+
+    print(
+        f"🧠 {report['postings']} postings: {report['compact_bytes'] / 1024:.1f} KB compact "
+        f"({report['compact_bytes_per_posting']} B/posting) vs "
+        f"{report['naive_bytes'] / 1024:.1f} KB as tuple lists "
+        f"({report['naive_bytes_per_posting']} B/posting), {report['ratio']}x smaller"
+    )
+
+
+BENCHMARKS = {
+    "startup": bench_startup,
+    "lexrank": bench_lexrank,
+    "keywords": bench_keywords,
+    "cpu_pool": bench_cpu_pool,
+    "postings": bench_postings,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the chatbot's start-up, retrieval and summarization"
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="NAME",
+        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)",
+    )
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    for name in args.benchmarks or BENCHMARKS:
+        print(f"📊 {name}")
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,51 @@
+import importlib.util
 import os
 import re
 import threading
 import time
 from datetime import datetime
-from typing import Optional, Tuple
-
-# Audio processing imports
-try:
-    import pygame
-    import speech_recognition as sr
-    from gtts import gTTS
-
-    AUDIO_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ Audio libraries not available: {e}")
-    AUDIO_AVAILABLE = False
-
-# NLP imports
-try:
-    import nltk
-    from nltk.tokenize import sent_tokenize, word_tokenize
-    from nltk.corpus import stopwords
-    from sumy.parsers.plaintext import PlaintextParser
-    from sumy.nlp.tokenizers import Tokenizer
-    from sumy.summarizers.lex_rank import LexRankSummarizer
-
-    NLP_AVAILABLE = True
-
-    # Download required NLTK data
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt", quiet=True)
-
-    try:
-        nltk.data.find("corpora/stopwords")
-    except LookupError:
-        nltk.download("stopwords", quiet=True)
-
-except ImportError as e:
-    print(f"⚠️ NLP libraries not available: {e}")
-    NLP_AVAILABLE = False
+from typing import Dict, Optional, Tuple
+
+import lexrank
+from keyword_matcher import KeywordAutomaton
+
+# Audio and NLP libraries are only located here; they are imported, and
+# NLTK data downloaded, on first use, so a headless server never loads them
+AUDIO_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("pygame", "speech_recognition", "gtts")
+)
+if not AUDIO_AVAILABLE:
+    print("⚠️ Audio libraries not available")
+
+NLP_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("nltk", "sumy")
+)
+if not NLP_AVAILABLE:
+    print("⚠️ NLP libraries not available")
+
+_imports_lock = threading.Lock()
+_sumy = None
+
+
+def load_sumy():
+    """sumy's parser, tokenizer and LexRank summarizer, imported on first use"""
+    global _sumy
+    with _imports_lock:
+        if _sumy is None:
+            import nltk
+            from sumy.nlp.tokenizers import Tokenizer
+            from sumy.parsers.plaintext import PlaintextParser
+            from sumy.summarizers.lex_rank import LexRankSummarizer
+
+            # sumy's English tokenizer needs NLTK's punkt data
+            try:
+                nltk.data.find("tokenizers/punkt")
+            except LookupError:
+                nltk.download("punkt", quiet=True)
+
+            _sumy = (PlaintextParser, Tokenizer, LexRankSummarizer)
+        return _sumy
 
 
 class EnhancedChatbotHelpers:
@@ -58,36 +63,26 @@ class EnhancedChatbotHelpers:
         self.temp_audio_dir = "temp_audio"
         os.makedirs(self.temp_audio_dir, exist_ok=True)
 
-        # Initialize pygame for audio
-        if AUDIO_AVAILABLE:
-            try:
-                pygame.mixer.init()
-                print("✅ Audio system initialized")
-            except Exception as e:
-                print(f"⚠️ Audio system initialization failed: {e}")
-
-        # Speech recognition
-        if AUDIO_AVAILABLE:
-            self.recognizer = sr.Recognizer()
-            self.microphone = sr.Microphone()
+        # The mixer and microphone are opened on first playback or recording
+        self._mixer = None
+        self.recognizer = None
+        self.microphone = None
+        self._audio_lock = threading.Lock()
 
-            # Adjust for ambient noise
-            try:
-                with self.microphone as source:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                print("✅ Speech recognition initialized")
-            except Exception as e:
-                print(f"⚠️ Speech recognition setup failed: {e}")
-
-        # Enhanced keywords for different subjects and institutional queries
+        # Enhanced keywords for different subjects and institutional queries.
+        # Keywords match whole words (plus plural endings), so derived forms
+        # such as "mathematical" or "examination" are listed on their own
         self.subject_keywords = {
             "mathematics": [
                 "math",
                 "mathematics",
+                "mathematical",
                 "number",
                 "calculate",
+                "calculation",
                 "equation",
                 "algebra",
+                "algebraic",
                 "geometry",
                 "fraction",
                 "decimal",
@@ -120,8 +115,13 @@ class EnhancedChatbotHelpers:
                 "chemistry",
                 "biology",
                 "experiment",
+                "experimental",
+                "experimentation",
                 "lab",
+                "laboratory",
+                "laboratories",
                 "atom",
+                "atomic",
                 "molecule",
                 "energy",
                 "force",
@@ -134,9 +134,11 @@ class EnhancedChatbotHelpers:
                 "plant",
                 "animal",
                 "cell",
+                "cellular",
                 "DNA",
                 "ecosystem",
                 "environment",
+                "environmental",
                 "climate",
                 "weather",
                 "earth",
@@ -158,6 +160,7 @@ class EnhancedChatbotHelpers:
                 "adjective",
                 "essay",
                 "story",
+                "storytelling",
                 "poem",
                 "reading",
                 "writing",
@@ -189,11 +192,13 @@ class EnhancedChatbotHelpers:
                 "politics",
                 "government",
                 "constitution",
+                "constitutional",
                 "rights",
                 "duties",
                 "democracy",
                 "culture",
                 "tradition",
+                "traditional",
                 "heritage",
                 "civilization",
                 "ancient",
@@ -219,7 +224,9 @@ class EnhancedChatbotHelpers:
             "admission",
             "fee",
             "exam",
+            "examination",
             "schedule",
+            "scheduled",
             "timetable",
             "syllabus",
             "holiday",
@@ -233,6 +240,7 @@ class EnhancedChatbotHelpers:
             "uniform",
             "bus",
             "transport",
+            "transportation",
             "canteen",
             "principal",
             "teacher",
@@ -259,6 +267,41 @@ class EnhancedChatbotHelpers:
             "वर्दी",
         ]
 
+        # All keyword lists compiled into one automaton, matched in a single pass
+        self.keyword_matcher = KeywordAutomaton(
+            {"institutional": self.institutional_keywords, **self.subject_keywords}
+        )
+
+        # English meaning of the native keywords above that the translation
+        # dictionary does not cover, used for native-script retrieval
+        self.native_keyword_meanings = {
+            "रसायन": "chemistry",
+            "जीव": "living organisms",
+            "प्रयोग": "experiment",
+            "ऊर्जा": "energy",
+            "बल": "force",
+            "वाक्य": "sentence",
+            "कहानी": "story",
+            "कविता": "poem",
+            "लेखन": "writing",
+            "नागरिकशास्त्र": "civics",
+            "सरकार": "government",
+            "संविधान": "constitution",
+            "अधिकार": "rights",
+            "फीस": "fee fees",
+            "छुट्टी": "holiday holidays",
+            "पुस्तक": "book books",
+            "वर्दी": "uniform",
+        }
+
+        # Seed the content index so native-script queries skip inbound translation
+        if self.content_manager:
+            if self.translation_service:
+                self.content_manager.native_terms.add_dictionary(
+                    self.translation_service.fallback_dict
+                )
+            self.content_manager.native_terms.add_terms(self.native_keyword_meanings)
+
         # Response templates for different languages
         self.response_templates = {
             "en": {
@@ -279,18 +322,9 @@ class EnhancedChatbotHelpers:
 
     def identify_intent_and_subject(self, query: str) -> Tuple[str, str]:
         """Identify user intent and subject from query"""
-        query_lower = query.lower()
-
-        # Check for institutional keywords first
-        institutional_score = sum(
-            1 for keyword in self.institutional_keywords if keyword in query_lower
-        )
-
-        # Check for subject keywords
-        subject_scores = {}
-        for subject, keywords in self.subject_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in query_lower)
-            subject_scores[subject] = score
+        # Whole-word keyword counts for every subject and the institutional list
+        subject_scores = self.keyword_matcher.count(query)
+        institutional_score = subject_scores.pop("institutional")
 
         # Determine intent
         if institutional_score > 0:
@@ -309,25 +343,42 @@ class EnhancedChatbotHelpers:
         try:
             print(f"📚 Processing subject query for {subject}: {query}")
 
-            # If no specific subject provided, try to identify from query
+            passages = None
+
+            # If no specific subject provided, search only the one or two
+            # subjects the corpus-trained router finds most likely
+            if subject == "general" and self.content_manager:
+                routes = self.content_manager.route_subjects(query)
+                if routes:
+                    print(
+                        "🧭 Routed to "
+                        + ", ".join(f"{name} ({p:.0%})" for name, p in routes)
+                    )
+                for name, _ in routes:
+                    routed = self.content_manager.find_relevant_passages(query, name)
+                    if routed is not None and routed["matched"]:
+                        subject, passages = name, routed
+                        break
+
+            # Without a router (or any known term), fall back to the keyword lists
             if subject == "general":
                 _, detected_subject = self.identify_intent_and_subject(query)
                 if detected_subject != "general":
                     subject = detected_subject
 
             # Load subject content
-            if subject != "general" and self.content_manager:
-                content = self.content_manager.load_subject_content(subject)
-                relevant_content = self.content_manager.find_relevant_content(
-                    query, content, 5
-                )
+            if passages is None and subject != "general" and self.content_manager:
+                passages = self.content_manager.find_relevant_passages(query, subject)
+
+            if passages is not None:
+                relevant_content = passages["content"]
             else:
                 # General educational response
                 relevant_content = self.generate_general_educational_response(query)
 
             # Process and format response
             response = self.process_educational_content(
-                query, relevant_content, subject
+                query, relevant_content, subject, passages
             )
 
             # Make child-friendly
@@ -345,8 +396,16 @@ class EnhancedChatbotHelpers:
         try:
             print(f"🏫 Processing institutional query: {query}")
 
+            # Canonical questions are answered straight from the FAQ table
+            faq = (
+                self.content_manager.answer_faq(query) if self.content_manager else None
+            )
+            if faq is not None:
+                print(f"⚡ FAQ {faq['match']} match: {faq['title']}")
+                relevant_content = faq["answer"]
+
             # Load institutional content
-            if self.content_manager:
+            elif self.content_manager:
                 content = self.content_manager.load_institutional_content()
                 relevant_content = self.content_manager.find_relevant_content(
                     query, content, 7
@@ -368,24 +427,26 @@ class EnhancedChatbotHelpers:
             return "I'm sorry, I couldn't find information about that right now. Please contact the school office for specific details."
 
     def process_educational_content(
-        self, query: str, content: str, subject: str
+        self, query: str, content: str, subject: str, passages: Optional[Dict] = None
     ) -> str:
-        """Process educational content into structured response"""
+        """Process educational content into structured response
+
+        `passages` (from ContentManager.find_relevant_passages) identifies the
+        retrieved content, so its summary is computed once and then cached.
+        """
         try:
             if not content:
                 return f"I don't have specific information about that {subject} topic. Could you try asking about a different concept?"
 
-            # Use NLP summarization if available
-            if NLP_AVAILABLE and len(content) > 500:
-                try:
-                    parser = PlaintextParser.from_string(content, Tokenizer("english"))
-                    summarizer = LexRankSummarizer()
-                    summary = summarizer(
-                        parser.document, 3
-                    )  # Get 3 most relevant sentences
-                    content = " ".join([str(sentence) for sentence in summary])
-                except Exception as e:
-                    print(f"⚠️ Summarization failed, using original content: {e}")
+            # Summarize long content: in-house LexRank, else sumy's
+            if (lexrank.NUMPY_AVAILABLE or NLP_AVAILABLE) and len(content) > 500:
+                if passages is not None and self.content_manager:
+                    content = self.content_manager.summarize_passages(
+                        passages,
+                        None if lexrank.NUMPY_AVAILABLE else self.summarize_text,
+                    )
+                else:
+                    content = self.summarize_text(content)
 
             # Structure the response
             response = f"Here's what I can tell you about your {subject} question:\n\n"
@@ -404,6 +465,26 @@ class EnhancedChatbotHelpers:
             print(f"❌ Error processing educational content: {e}")
             return content
 
+    def summarize_text(self, content: str) -> str:
+        """Three most central sentences of a text (LexRank), or the text on failure"""
+        try:
+            if lexrank.NUMPY_AVAILABLE:
+                if self.content_manager:
+                    summary = self.content_manager.cpu_pool.run(
+                        lexrank.summarize_text, content
+                    )
+                else:
+                    summary = lexrank.summarize_text(content)
+                return summary or content
+            PlaintextParser, Tokenizer, LexRankSummarizer = load_sumy()
+            parser = PlaintextParser.from_string(content, Tokenizer("english"))
+            summarizer = LexRankSummarizer()
+            summary = summarizer(parser.document, 3)  # Get 3 most relevant sentences
+            return " ".join([str(sentence) for sentence in summary])
+        except Exception as e:
+            print(f"⚠️ Summarization failed, using original content: {e}")
+            return content
+
     def process_institutional_content(self, query: str, content: str) -> str:
         """Process institutional content into helpful response"""
         try:
@@ -508,6 +589,36 @@ class EnhancedChatbotHelpers:
         )
 
     # Speech and Audio Functions
+    def get_mixer(self):
+        """pygame's mixer, imported and initialized on first use"""
+        with self._audio_lock:
+            if self._mixer is None:
+                import pygame
+
+                pygame.mixer.init()
+                print("✅ Audio system initialized")
+                self._mixer = pygame.mixer
+            return self._mixer
+
+    def get_microphone(self):
+        """Speech recognizer and microphone, opened and calibrated on first use"""
+        with self._audio_lock:
+            if self.microphone is None:
+                import speech_recognition as sr
+
+                recognizer = sr.Recognizer()
+                microphone = sr.Microphone()
+
+                # Adjust for ambient noise
+                try:
+                    with microphone as source:
+                        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                    print("✅ Speech recognition initialized")
+                except Exception as e:
+                    print(f"⚠️ Speech recognition setup failed: {e}")
+                self.recognizer, self.microphone = recognizer, microphone
+            return self.recognizer, self.microphone
+
     def speech_to_text(
         self, timeout: int = 5, phrase_timeout: int = 2
     ) -> Tuple[str, str]:
@@ -515,12 +626,15 @@ class EnhancedChatbotHelpers:
         if not AUDIO_AVAILABLE:
             raise Exception("Speech recognition not available")
 
+        import speech_recognition as sr
+
         try:
+            recognizer, microphone = self.get_microphone()
             print("🎤 Listening for speech...")
 
-            with self.microphone as source:
+            with microphone as source:
                 # Listen for audio
-                audio = self.recognizer.listen(
+                audio = recognizer.listen(
                     source, timeout=timeout, phrase_time_limit=phrase_timeout
                 )
 
@@ -533,9 +647,7 @@ class EnhancedChatbotHelpers:
                 try:
                     # Convert language code to format expected by speech_recognition
                     recognition_lang = self.get_recognition_language_code(lang)
-                    text = self.recognizer.recognize_google(
-                        audio, language=recognition_lang
-                    )
+                    text = recognizer.recognize_google(audio, language=recognition_lang)
 
                     if text:
                         print(f"✅ Speech recognized in {lang}: {text}")
@@ -548,7 +660,7 @@ class EnhancedChatbotHelpers:
 
             # If no language worked, try default English
             try:
-                text = self.recognizer.recognize_google(audio, language="en-US")
+                text = recognizer.recognize_google(audio, language="en-US")
                 return text, "en"
             except:
                 raise Exception("Could not understand the audio")
@@ -590,6 +702,8 @@ class EnhancedChatbotHelpers:
             tts_lang = self.get_tts_language_code(language)
 
             # Generate TTS
+            from gtts import gTTS
+
             tts = gTTS(text=clean_text, lang=tts_lang, slow=False)
 
             # Save to temporary file
@@ -665,8 +779,9 @@ class EnhancedChatbotHelpers:
             self.stop_audio()
 
             # Load and play audio
-            pygame.mixer.music.load(filepath)
-            pygame.mixer.music.play()
+            mixer = self.get_mixer()
+            mixer.music.load(filepath)
+            mixer.music.play()
 
             self.audio_playing = True
 
@@ -687,7 +802,7 @@ class EnhancedChatbotHelpers:
     def _monitor_audio_playback(self):
         """Monitor audio playback in separate thread"""
         try:
-            while pygame.mixer.music.get_busy():
+            while self._mixer.music.get_busy():
                 time.sleep(0.1)
 
             self.audio_playing = False
@@ -703,8 +818,8 @@ class EnhancedChatbotHelpers:
             return False
 
         try:
-            if self.audio_playing:
-                pygame.mixer.music.stop()
+            if self.audio_playing and self._mixer is not None:
+                self._mixer.music.stop()
                 self.audio_playing = False
                 print("🔇 Audio stopped")
 
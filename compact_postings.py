@@ -0,0 +1,170 @@
+import sys
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Heap cost of the naive representation: a list of (paragraph id, count) tuples
+_TUPLE_BYTES = sys.getsizeof((1000, 1000))
+_INT_BYTES = sys.getsizeof(1000)
+_LIST_BYTES = sys.getsizeof([])
+_BYTES_OVERHEAD = sys.getsizeof(b"")
+
+
+def encode_postings(postings: List[Tuple[int, int]]) -> bytes:
+    """Varint-encode a sorted posting list as: length, then (id delta, count) pairs"""
+    out = bytearray()
+    previous = 0
+    values = [len(postings)]
+    for paragraph_id, count in postings:
+        values.append(paragraph_id - previous)
+        values.append(count)
+        previous = paragraph_id
+
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_varints(blob: bytes) -> List[int]:
+    values = []
+    value = shift = 0
+    for byte in blob:
+        if byte & 0x80:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        else:
+            values.append(value | (byte << shift))
+            value = shift = 0
+    return values
+
+
+def decode_values(blob: bytes) -> List[int]:
+    """Decode a varint byte string into its integers"""
+    # Deltas and counts are almost always below 128: one byte each, no loop
+    if blob.isascii():
+        return list(blob)
+
+    # Often only the leading length needs more than one byte
+    header = 0
+    while blob[header] & 0x80:
+        header += 1
+    body = blob[header + 1 :]
+    if body.isascii():
+        return _decode_varints(blob[: header + 1]) + list(body)
+    return _decode_varints(blob)
+
+
+def decode_columns(blob: bytes) -> Tuple[List[int], List[int]]:
+    """Paragraph ids and counts of an encoded posting list, as two lists"""
+    values = decode_values(blob)
+    return list(accumulate(values[1::2])), values[2::2]
+
+
+def decode_postings(blob: bytes) -> List[Tuple[int, int]]:
+    """Inverse of encode_postings"""
+    return list(zip(*decode_columns(blob)))
+
+
+def naive_postings_bytes(postings: List[Tuple[int, int]]) -> int:
+    """Heap bytes of a posting list held as a Python list of int tuples"""
+    # Ints from -5 to 256 are shared singletons; larger ones are separate objects
+    large = sum(
+        (paragraph_id > 256) + (count > 256) for paragraph_id, count in postings
+    )
+    return (
+        _LIST_BYTES
+        + 8 * len(postings)
+        + _TUPLE_BYTES * len(postings)
+        + _INT_BYTES * large
+    )
+
+
+class CompactPostings:
+    """Term -> [(paragraph id, count)] mapping stored as delta+varint byte strings
+
+    Drop-in for the dict of tuple lists the index used to hold: lookups decode
+    one term's postings on demand, which costs less than scoring them.
+    """
+
+    __slots__ = ("_blobs",)
+
+    def __init__(self, postings: Dict[str, List[Tuple[int, int]]]):
+        self._blobs: Dict[str, bytes] = {
+            term: encode_postings(entries) for term, entries in postings.items()
+        }
+
+    def get(self, term: str, default=None):
+        blob = self._blobs.get(term)
+        if blob is None:
+            return default
+        return decode_postings(blob)
+
+    def __getitem__(self, term: str):
+        return decode_postings(self._blobs[term])
+
+    def columns(self, term: str) -> Optional[Tuple[List[int], List[int]]]:
+        """(paragraph ids, counts) of a term, or None; cheaper than tuples to score"""
+        blob = self._blobs.get(term)
+        return decode_columns(blob) if blob is not None else None
+
+    def frequency(self, term: str) -> int:
+        """Number of paragraphs containing a term, without decoding its postings"""
+        blob = self._blobs.get(term)
+        if blob is None:
+            return 0
+        value = shift = 0
+        for byte in blob:
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+        return value
+
+    def frequencies(self) -> Dict[str, int]:
+        """Number of paragraphs containing every term"""
+        return {term: self.frequency(term) for term in self._blobs}
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._blobs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blobs)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def posting_count(self) -> int:
+        """Total (paragraph, count) entries across all terms"""
+        return sum(self.frequency(term) for term in self._blobs)
+
+    def nbytes(self) -> int:
+        """Heap bytes of the encoded postings (not counting the term strings)"""
+        return sum(_BYTES_OVERHEAD + len(blob) for blob in self._blobs.values())
+
+    def naive_nbytes(self) -> int:
+        """Heap bytes the same postings would take as lists of tuples"""
+        return sum(
+            naive_postings_bytes(decode_postings(blob)) for blob in self._blobs.values()
+        )
+
+
+def memory_report(documents) -> Dict:
+    """Bytes per posting of the compact encoding against the naive tuple lists"""
+    postings = compact = naive = 0
+    for document in documents:
+        if not isinstance(document.postings, CompactPostings):
+            continue  # Memory-mapped pack documents live outside the heap
+        postings += document.postings.posting_count()
+        compact += document.postings.nbytes()
+        naive += document.postings.naive_nbytes()
+
+    return {
+        "postings": postings,
+        "compact_bytes": compact,
+        "naive_bytes": naive,
+        "compact_bytes_per_posting": round(compact / postings, 2) if postings else 0.0,
+        "naive_bytes_per_posting": round(naive / postings, 2) if postings else 0.0,
+        "ratio": round(naive / compact, 1) if compact else 0.0,
+    }
@@ -0,0 +1,583 @@
+import bisect
+import heapq
+import math
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from compact_postings import CompactPostings
+
+TOKEN_PATTERN = re.compile(r"\w+")
+HEADER_PATTERN = re.compile(r"^#{1,6}\s+", flags=re.MULTILINE)
+EXTRA_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+SECTION_PATTERN = re.compile(r"^\*\*(.+?)\*\*")
+SECTION_BLOCK_PATTERN = re.compile(r"(?:^|(?<=\n\n))\*\*(.+?)\*\*")
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+NUMBERED_ITEM_PATTERN = re.compile(r"^\s*(?:\*\*)?\d{1,3}[.)]\s+")
+ENUMERATOR_PATTERN = re.compile(
+    r"^(?:[-*•]\s*)?(?:\*\*)?(?:\d{1,3}|[A-Za-z]|[ivxIVX]{2,4})[.)]\s+"
+)
+
+# Words whose trailing full stop does not end a sentence
+ABBREVIATIONS = frozenset(
+    "e.g i.e etc vs cf mr mrs ms dr prof st no nos fig approx a.m p.m".split()
+)
+HEADING_LINE_PATTERN = re.compile(r"^\s*\*\*[^*]+\*\*:?\s*$")
+
+# Okapi BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+# Question and function words that carry no topical signal for ranking
+STOPWORDS = frozenset("""
+    a an the is are was were be been am do does did can could will would should
+    shall may might must what which who whom whose when where why how that this
+    these those there here of in on at to for from by with about as into than
+    then and or but not no so if it its i me my we our you your he she they them
+    his her their tell explain define describe please give show some any
+    """.split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def clean_text(text: str) -> str:
+    """Strip markdown headers and stray whitespace for presentation"""
+    if not text:
+        return ""
+
+    # Remove excessive markdown headers for cleaner presentation
+    text = HEADER_PATTERN.sub("", text)
+
+    # Remove extra whitespace but keep paragraph breaks
+    cleaned_lines = []
+    for line in text.split("\n"):
+        cleaned_line = line.strip()
+        if cleaned_line:
+            cleaned_lines.append(cleaned_line)
+        elif cleaned_lines and cleaned_lines[-1]:  # Preserve paragraph breaks
+            cleaned_lines.append("")
+
+    # Remove excessive newlines
+    return EXTRA_NEWLINES_PATTERN.sub("\n\n", "\n".join(cleaned_lines)).strip()
+
+
+def split_headed_sentences(text: str) -> List[Tuple[str, str]]:
+    """(heading, sentence) pairs of cleaned text: every line, split again
+    after . ! or ?
+
+    Lone `**Topic**` heading lines are not sentences; each sentence carries
+    the last one above it instead ("" before the first). Consecutive numbered
+    lines ("1. ...", "2. ...") stay together as one sentence, so an answer
+    never keeps only some of the steps.
+    """
+    sentences = []
+    heading = ""
+    numbered = False
+    for line in text.split("\n"):
+        if HEADING_LINE_PATTERN.match(line):
+            heading = line.strip().strip("*:").strip()
+            numbered = False
+            continue
+        if NUMBERED_ITEM_PATTERN.match(line):
+            if numbered:
+                sentences[-1] = (heading, sentences[-1][1] + "\n" + line.strip())
+            else:
+                sentences.append((heading, line.strip()))
+            numbered = True
+            continue
+        numbered = False
+        sentences.extend((heading, sentence) for sentence in split_line(line))
+    return sentences
+
+
+def split_line(line: str) -> List[str]:
+    """Sentences of one line: split after . ! or ?, but not after a leading
+    list number ("1.", "b)") or an abbreviation such as "e.g." or "vs." """
+    line = line.strip()
+    enumerator = ENUMERATOR_PATTERN.match(line)
+    sentences = []
+    start = 0
+    for end in SENTENCE_END_PATTERN.finditer(
+        line, enumerator.end() if enumerator else 0
+    ):
+        word = line[start : end.start()].rsplit(None, 1)[-1]
+        if word.rstrip(".").lstrip("(").lower() in ABBREVIATIONS:
+            continue
+        sentences.append(line[start : end.start()])
+        start = end.end()
+    if start < len(line):
+        sentences.append(line[start:])
+    return sentences
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of cleaned text, without their headings"""
+    return [sentence for _, sentence in split_headed_sentences(text)]
+
+
+def starts_structure(block: str) -> bool:
+    """Whether a block opens a chapter or a section"""
+    block = block.lstrip()
+    return block.startswith("## ") or SECTION_PATTERN.match(block) is not None
+
+
+def is_bare_heading(block: str) -> bool:
+    """Whether a block is only a chapter or section heading line"""
+    return "\n" not in block.strip() and starts_structure(block)
+
+
+def segment_passages(
+    text: str, target_chars: Optional[int] = None, overlap_lines: int = 1
+) -> List[Tuple[str, str]]:
+    """Split text into (passage, overlap context) pairs for indexing
+
+    Without a target every blank-line block is a passage. With one, short
+    blocks are merged and long ones cut into line windows of about
+    target_chars; each window also indexes (but does not display) the last
+    overlap_lines lines of the window before it. Chapters always start a new
+    passage, while consecutive short sections share one up to target_chars
+    (DocumentIndex records where each of them starts). A bare heading joins
+    the block after it (a `**Topic**` block included) unless that block
+    opens the next chapter.
+    """
+    blocks = [block for block in text.split("\n\n") if block.strip()]
+    if not target_chars:
+        return [(block, "") for block in blocks]
+
+    passages: List[Tuple[str, str]] = []
+    pending: List[str] = []
+    pending_size = 0
+
+    for block in blocks:
+        chapter = block.lstrip().startswith("## ")
+        heading_only = len(pending) == 1 and is_bare_heading(pending[0])
+        joins = not chapter and (
+            heading_only or pending_size + 2 + len(block) <= target_chars
+        )
+        if pending and not joins:
+            # A bare heading moves on with the block it introduces
+            carried = []
+            if not chapter and len(pending) > 1 and is_bare_heading(pending[-1]):
+                carried = [pending.pop()]
+            passages.append(("\n\n".join(pending), ""))
+            pending = carried
+            pending_size = sum(len(heading) + 2 for heading in carried)
+
+        if len(block) <= target_chars:
+            pending.append(block)
+            pending_size += len(block) + 2
+            continue
+
+        # Cut a long block into line windows, the heading (if any) leading the first
+        prefix = "\n\n".join(pending)
+        pending, pending_size = [], 0
+        window: List[str] = []
+        window_size = len(prefix)
+        context = ""
+        for line in block.split("\n"):
+            if window and window_size + 1 + len(line) > target_chars:
+                passages.append((_join_window(prefix, window), context))
+                context = "\n".join(window[-overlap_lines:]) if overlap_lines else ""
+                prefix, window, window_size = "", [], 0
+            window.append(line)
+            window_size += len(line) + 1
+        if window:
+            passages.append((_join_window(prefix, window), context))
+
+    if pending:
+        passages.append(("\n\n".join(pending), ""))
+    return passages
+
+
+def passage_frequencies(
+    text: str, passage_chars: Optional[int] = None, overlap_lines: int = 1
+) -> Dict[str, int]:
+    """Number of passages every term occurs in, counted as DocumentIndex
+    would, without building the index"""
+    frequencies: Dict[str, int] = {}
+    for passage, context in segment_passages(text, passage_chars, overlap_lines):
+        for term in set(tokenize(f"{passage}\n{context}" if context else passage)):
+            frequencies[term] = frequencies.get(term, 0) + 1
+    return frequencies
+
+
+def _term_counts(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for term in tokenize(text):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def _join_window(prefix: str, lines: List[str]) -> str:
+    text = "\n".join(lines)
+    return f"{prefix}\n\n{text}" if prefix else text
+
+
+def query_terms(query: str) -> List[str]:
+    """Tokenize a query, dropping stopwords unless nothing else is left"""
+    tokens = tokenize(query)
+    terms = [token for token in tokens if token not in STOPWORDS]
+    return terms or tokens
+
+
+class DocumentIndex:
+    """Inverted index with BM25 statistics for the paragraphs of one content file
+
+    Paragraphs are also grouped into a chapter -> section hierarchy taken from
+    the `## Chapter` headings and `**Topic**` sub-headings of the file.
+    """
+
+    # Derived lookups, built on first use
+    _paragraph_chapters: Optional[List[int]] = None
+    _chapter_lengths: Optional[List[int]] = None
+    _outline: Optional[List[Dict]] = None
+    _estimated_bytes: Optional[int] = None
+    _sentences: Optional[
+        Dict[int, List[Tuple[str, Dict[str, int], Dict[str, int]]]]
+    ] = None
+
+    def __init__(
+        self,
+        key: str,
+        text: str,
+        passage_chars: Optional[int] = None,
+        overlap_lines: int = 1,
+    ):
+        self.key = key
+        self.text = text
+        self.version = 0  # Snapshot version that (re-)indexed this document
+        # Passage windowing the document was indexed with (None: blank-line blocks)
+        self.passage_chars = passage_chars
+        self.overlap_lines = overlap_lines
+        self.paragraphs: List[str] = []
+        self.display: List[str] = []  # Cleaned once here, never per query
+        self.lengths = array("I")
+        self.chapters: List[Tuple[str, int]] = []  # (heading, first paragraph id)
+        # (title, chapter id or -1 before the first chapter, first paragraph id,
+        # offset of its heading in that paragraph's display text)
+        self.sections: List[Tuple[str, int, int, int]] = []
+
+        # Tuple lists only while building; kept delta+varint encoded afterwards
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+
+        for paragraph, context in segment_passages(text, passage_chars, overlap_lines):
+            paragraph_id = len(self.paragraphs)
+            display = clean_text(paragraph)
+            # A chapter heading may lead the first section of that chapter
+            body = 0
+            if paragraph.lstrip().startswith("## "):
+                heading = paragraph.lstrip().partition("\n")[0]
+                self.chapters.append((heading.lstrip("#").strip(), paragraph_id))
+                body = len(display) - len(display.partition("\n")[2].lstrip("\n"))
+            # Every `**Topic**` block, as short sections share a passage; one
+            # right under a bare heading belongs to that heading's section,
+            # unless the heading itself directly follows the chapter title
+            for match in SECTION_BLOCK_PATTERN.finditer(display[body:]):
+                above = display[body : body + match.start()].rstrip("\n")
+                blocks = above.split("\n\n") if above else []
+                if blocks and is_bare_heading(blocks[-1]):
+                    if not (body and len(blocks) == 1):
+                        continue
+                title = match.group(1).strip().rstrip(":").strip()
+                self.sections.append(
+                    (title, len(self.chapters) - 1, paragraph_id, body + match.start())
+                )
+
+            tokens = tokenize(f"{paragraph}\n{context}" if context else paragraph)
+            self.paragraphs.append(paragraph)
+            self.display.append(display)
+            self.lengths.append(len(tokens))
+
+            term_counts: Dict[str, int] = {}
+            for term in tokens:
+                term_counts[term] = term_counts.get(term, 0) + 1
+            for term, count in term_counts.items():
+                postings.setdefault(term, []).append((paragraph_id, count))
+
+        # Precompute everything BM25 needs that does not depend on the query
+        paragraph_count = len(self.paragraphs)
+        self.average_length = (
+            sum(self.lengths) / paragraph_count if paragraph_count else 0.0
+        ) or 1.0
+        self.idf: Dict[str, float] = {
+            term: math.log(
+                1 + (paragraph_count - len(entries) + 0.5) / (len(entries) + 0.5)
+            )
+            for term, entries in postings.items()
+        }
+        self.length_norms = array(
+            "d",
+            (
+                BM25_K1 * (1 - BM25_B + BM25_B * length / self.average_length)
+                for length in self.lengths
+            ),
+        )
+        self.postings = CompactPostings(postings)
+
+    def score(
+        self,
+        query_terms: Iterable[str],
+        ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> Dict[int, float]:
+        """BM25 score for every candidate paragraph sharing a query term
+
+        With `ranges`, only postings inside those [start, end) paragraph spans
+        are scored; postings are sorted by paragraph id, so each span is a slice.
+        """
+        scores: Dict[int, float] = {}
+        for term in set(query_terms):
+            columns = self.postings.columns(term)
+            if not columns:
+                continue
+
+            paragraph_ids, counts = columns
+            if ranges is not None:
+                spans = [
+                    (
+                        bisect.bisect_left(paragraph_ids, start),
+                        bisect.bisect_left(paragraph_ids, end),
+                    )
+                    for start, end in ranges
+                ]
+                paragraph_ids = [i for lo, hi in spans for i in paragraph_ids[lo:hi]]
+                counts = [c for lo, hi in spans for c in counts[lo:hi]]
+
+            idf = self.idf[term]
+            for paragraph_id, count in zip(paragraph_ids, counts):
+                weight = (
+                    idf
+                    * count
+                    * (BM25_K1 + 1)
+                    / (count + self.length_norms[paragraph_id])
+                )
+                scores[paragraph_id] = scores.get(paragraph_id, 0.0) + weight
+        return scores
+
+    def search(
+        self, query_terms: Iterable[str], top_k: int = 3
+    ) -> List[Tuple[int, float]]:
+        """Top-k (paragraph id, score) pairs, best first, earlier paragraphs winning ties"""
+        scores = self.score(query_terms)
+        return heapq.nlargest(
+            top_k, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+
+    def chapter_range(self, chapter_id: int) -> Tuple[int, int]:
+        """[start, end) paragraph ids of a chapter (-1 is the text before chapter 1)"""
+        start = self.chapters[chapter_id][1] if chapter_id >= 0 else 0
+        if chapter_id + 1 < len(self.chapters):
+            return start, self.chapters[chapter_id + 1][1]
+        return start, len(self.paragraphs)
+
+    def get_paragraph_chapters(self) -> List[int]:
+        """Chapter id of every paragraph (-1 before the first chapter)"""
+        if self._paragraph_chapters is None:
+            starts = [first for _, first in self.chapters]
+            self._paragraph_chapters = [
+                bisect.bisect_right(starts, paragraph_id) - 1
+                for paragraph_id in range(len(self.paragraphs))
+            ]
+        return self._paragraph_chapters
+
+    def rank_chapters(
+        self, query_terms: Iterable[str], top_k: int = 2
+    ) -> List[Tuple[int, float]]:
+        """Top-k (chapter id, score) pairs, scoring each chapter as one BM25 document
+
+        Chapter term frequencies are summed from the paragraph postings, so no
+        separate chapter index has to be built or stored.
+        """
+        chapter_of = self.get_paragraph_chapters()
+        if self._chapter_lengths is None:
+            lengths = [0] * (len(self.chapters) + 1)  # Slot 0 holds the preamble
+            for paragraph_id, length in enumerate(self.lengths):
+                lengths[chapter_of[paragraph_id] + 1] += length
+            self._chapter_lengths = lengths
+
+        lengths = self._chapter_lengths
+        average_length = (sum(lengths) / len(lengths)) or 1.0
+
+        scores: Dict[int, float] = {}
+        for term in set(query_terms):
+            columns = self.postings.columns(term)
+            if not columns:
+                continue
+
+            counts: Dict[int, int] = {}
+            for paragraph_id, count in zip(*columns):
+                chapter_id = chapter_of[paragraph_id]
+                counts[chapter_id] = counts.get(chapter_id, 0) + count
+
+            idf = math.log(1 + (len(lengths) - len(counts) + 0.5) / (len(counts) + 0.5))
+            for chapter_id, count in counts.items():
+                norm = BM25_K1 * (
+                    1 - BM25_B + BM25_B * lengths[chapter_id + 1] / average_length
+                )
+                weight = idf * count * (BM25_K1 + 1) / (count + norm)
+                scores[chapter_id] = scores.get(chapter_id, 0.0) + weight
+
+        return heapq.nlargest(
+            top_k, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+
+    def search_chapters_first(
+        self, query_terms: Iterable[str], top_k: int = 3, chapter_k: int = 2
+    ) -> List[Tuple[int, float]]:
+        """Two-stage search: pick the best chapters, then rank only their paragraphs"""
+        if not self.chapters:
+            return self.search(query_terms, top_k)
+
+        query_terms = list(query_terms)
+        chapters = self.rank_chapters(query_terms, chapter_k)
+        ranges = sorted(self.chapter_range(chapter_id) for chapter_id, _ in chapters)
+        scores = self.score(query_terms, ranges)
+        return heapq.nlargest(
+            top_k, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+
+    def get_outline(self) -> List[Dict]:
+        """Chapter -> section table of contents with section ids for direct lookup"""
+        if self._outline is None:
+            outline = [
+                {"id": chapter_id, "title": title, "sections": []}
+                for chapter_id, (title, _) in enumerate(self.chapters)
+            ]
+            for section_id, (title, chapter_id, _, _) in enumerate(self.sections):
+                if chapter_id >= 0:
+                    outline[chapter_id]["sections"].append(
+                        {"id": section_id, "title": title}
+                    )
+            self._outline = outline
+        return self._outline
+
+    def get_section(self, section_id: int) -> Optional[Dict]:
+        """Get one section's title, chapter and cleaned text by id"""
+        if not 0 <= section_id < len(self.sections):
+            return None
+
+        title, chapter_id, start, offset = self.sections[section_id]
+        end = (self.chapter_range(chapter_id)[1], 0)
+        if section_id + 1 < len(self.sections):
+            end = min(end, self.sections[section_id + 1][2:])
+
+        return {
+            "id": section_id,
+            "title": title,
+            "chapter": self.chapters[chapter_id][0] if chapter_id >= 0 else None,
+            "content": self.get_span((start, offset), end),
+        }
+
+    def get_span(self, start: Tuple[int, int], end: Tuple[int, int]) -> str:
+        """Display text from one (paragraph id, offset) position up to another"""
+        (first, offset), (last, end_offset) = start, end
+        if first == last:
+            return self.display[first][offset:end_offset].strip()
+        parts = [self.display[first][offset:]] + self.display[first + 1 : last]
+        if end_offset:
+            parts.append(self.display[last][:end_offset])
+        return "\n\n".join(part.strip() for part in parts if part.strip())
+
+    def get_sentences(
+        self, paragraph_id: int
+    ) -> List[Tuple[str, Dict[str, int], Dict[str, int]]]:
+        """Sentences of a passage with their term counts and those of the
+        `**Topic**` heading above them, split and tokenized once"""
+        if self._sentences is None:
+            self._sentences = {}
+        sentences = self._sentences.get(paragraph_id)
+        if sentences is None:
+            sentences = []
+            heading_counts: Dict[str, Dict[str, int]] = {}
+            for heading, sentence in split_headed_sentences(self.display[paragraph_id]):
+                if heading not in heading_counts:
+                    heading_counts[heading] = _term_counts(heading)
+                sentences.append(
+                    (sentence, _term_counts(sentence), heading_counts[heading])
+                )
+            self._sentences[paragraph_id] = sentences
+        return sentences
+
+    def estimated_bytes(self) -> int:
+        """Rough heap footprint of this index, for the shard memory budget"""
+        if self._estimated_bytes is None:
+            characters = len(self.text) + sum(
+                len(paragraph) + len(display)
+                for paragraph, display in zip(self.paragraphs, self.display)
+            )
+            # Encoded postings plus ~200 bytes per term for its dict entries
+            self._estimated_bytes = (
+                characters + self.postings.nbytes() + 200 * len(self.postings)
+            )
+        return self._estimated_bytes
+
+    def __len__(self) -> int:
+        return len(self.paragraphs)
+
+
+class ContentIndex:
+    """Immutable library-wide snapshot holding one DocumentIndex per content file
+
+    Updates build a new snapshot that shares every unchanged DocumentIndex, so
+    a reader holding a reference never sees a half-built index.
+    """
+
+    def __init__(
+        self, documents: Optional[Dict[str, DocumentIndex]] = None, version: int = 0
+    ):
+        self.documents: Dict[str, DocumentIndex] = dict(documents or {})
+        self.version = version
+        self._keys_by_text: Optional[Dict[str, str]] = None
+
+    def with_document(
+        self,
+        key: str,
+        text: str,
+        document_version: Optional[int] = None,
+        **passage_options,
+    ) -> "ContentIndex":
+        """New snapshot with one document (re-)indexed and the rest shared
+
+        `document_version` identifies the document's content (the same text
+        re-indexed keeps it); by default it is the new snapshot version.
+        passage_options (passage_chars, overlap_lines) go to DocumentIndex.
+        """
+        document = DocumentIndex(key, text, **passage_options)
+        document.version = (
+            document_version if document_version is not None else self.version + 1
+        )
+
+        documents = dict(self.documents)
+        documents[key] = document
+        return ContentIndex(documents, self.version + 1)
+
+    def without_document(self, key: str) -> "ContentIndex":
+        """New snapshot with one document dropped (evicted or deleted)"""
+        documents = dict(self.documents)
+        documents.pop(key, None)
+        return ContentIndex(documents, self.version + 1)
+
+    def get(self, key: str) -> Optional[DocumentIndex]:
+        """Get the index for a document key"""
+        return self.documents.get(key)
+
+    def document_for_text(self, text: str) -> Optional[DocumentIndex]:
+        """Find the indexed document whose full text matches"""
+        if self._keys_by_text is None:
+            self._keys_by_text = {
+                document.text: key for key, document in self.documents.items()
+            }
+        key = self._keys_by_text.get(text)
+        return self.documents.get(key) if key is not None else None
+
+    def get_stats(self) -> Dict:
+        """Get size statistics for the index"""
+        return {
+            "version": self.version,
+            "documents": len(self.documents),
+            "paragraphs": sum(len(doc) for doc in self.documents.values()),
+            "terms": sum(len(doc.postings) for doc in self.documents.values()),
+        }
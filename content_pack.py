@@ -0,0 +1,388 @@
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterator, Optional, Tuple
+
+from content_index import ContentIndex, DocumentIndex
+
+PACK_MAGIC = b"TVXPACK\0"
+PACK_FORMAT_VERSION = 7
+PACK_FILENAME = "content.pack"
+
+# magic, format version, byte order (0 little / 1 big), table of contents size
+_HEADER = struct.Struct("<8sIII")
+
+
+class PackError(Exception):
+    """Raised when a content pack is missing, corrupt or from another version"""
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return (offset + boundary - 1) // boundary * boundary
+
+
+class _SectionWriter:
+    """Append aligned binary sections and remember where they start"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def add(self, data: bytes) -> list:
+        self.buffer.extend(b"\0" * (_align(len(self.buffer)) - len(self.buffer)))
+        offset = len(self.buffer)
+        self.buffer.extend(data)
+        return [offset, len(data)]
+
+    def add_strings(self, strings: Sequence[str]) -> Tuple[list, list]:
+        """Concatenated UTF-8 blob plus a u32 array of n + 1 byte offsets"""
+        offsets = array("I", [0])
+        blob = bytearray()
+        for value in strings:
+            blob.extend(value.encode("utf-8"))
+            offsets.append(len(blob))
+        return self.add(bytes(blob)), self.add(offsets.tobytes())
+
+
+def build_content_pack(
+    index: ContentIndex,
+    path: str,
+    sources: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+) -> Dict:
+    """Compile an index snapshot into a pack file, returning its size stats"""
+    sources = sources or {}
+    writer = _SectionWriter()
+    documents = {}
+    vocabulary: Dict[str, int] = {}
+
+    for key, document in index.documents.items():
+        terms = sorted(document.postings)
+        for term, frequency in document.postings.frequencies().items():
+            vocabulary[term] = vocabulary.get(term, 0) + frequency
+        postings_start = array("I", [0])
+        posting_paragraphs = array("I")
+        posting_counts = array("I")
+        for term in terms:
+            for paragraph_id, count in document.postings[term]:
+                posting_paragraphs.append(paragraph_id)
+                posting_counts.append(count)
+            postings_start.append(len(posting_paragraphs))
+
+        text = writer.add(document.text.encode("utf-8"))
+        paragraphs, paragraph_offsets = writer.add_strings(document.paragraphs)
+        display, display_offsets = writer.add_strings(document.display)
+        term_blob, term_offsets = writer.add_strings(terms)
+
+        documents[key] = {
+            "source": sources.get(key),
+            "paragraph_count": len(document.paragraphs),
+            "term_count": len(terms),
+            "average_length": document.average_length,
+            "passage_chars": document.passage_chars,
+            "overlap_lines": document.overlap_lines,
+            "chapters": document.chapters,
+            "topics": document.sections,
+            "sections": {
+                "text": text,
+                "paragraphs": paragraphs,
+                "paragraph_offsets": paragraph_offsets,
+                "display": display,
+                "display_offsets": display_offsets,
+                "lengths": writer.add(array("I", document.lengths).tobytes()),
+                "length_norms": writer.add(array("d", document.length_norms).tobytes()),
+                "terms": term_blob,
+                "term_offsets": term_offsets,
+                "idf": writer.add(
+                    array("d", [document.idf[term] for term in terms]).tobytes()
+                ),
+                "postings_start": writer.add(postings_start.tobytes()),
+                "posting_paragraphs": writer.add(posting_paragraphs.tobytes()),
+                "posting_counts": writer.add(posting_counts.tobytes()),
+            },
+        }
+
+    # Library-wide term -> paragraph count table, so the spelling index
+    # never has to walk every document's postings at start-up
+    vocabulary_terms = sorted(vocabulary)
+    vocabulary_blob, vocabulary_offsets = writer.add_strings(vocabulary_terms)
+    vocabulary_counts = writer.add(
+        array("I", [vocabulary[term] for term in vocabulary_terms]).tobytes()
+    )
+
+    toc = json.dumps(
+        {
+            "built_at": time.time(),
+            "documents": documents,
+            "vocabulary": {
+                "terms": vocabulary_blob,
+                "term_offsets": vocabulary_offsets,
+                "frequencies": vocabulary_counts,
+            },
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    data_start = _align(_HEADER.size + len(toc))
+    header = _HEADER.pack(
+        PACK_MAGIC,
+        PACK_FORMAT_VERSION,
+        0 if sys.byteorder == "little" else 1,
+        len(toc),
+    )
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(toc)
+        f.write(b"\0" * (data_start - _HEADER.size - len(toc)))
+        f.write(writer.buffer)
+
+    # Replace atomically so running workers keep their old mapping intact
+    os.replace(temp_path, path)
+
+    return {
+        "path": path,
+        "documents": len(documents),
+        "bytes": data_start + len(writer.buffer),
+    }
+
+
+class _PackedStrings(Sequence):
+    """Read-only sequence of strings decoded on access from a UTF-8 blob"""
+
+    def __init__(self, blob: memoryview, offsets: memoryview):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("packed string index out of range")
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return str(self._blob[start:end], "utf-8")
+
+
+class _PackedPostings:
+    """Term -> [(paragraph id, count)] view over the packed posting arrays"""
+
+    def __init__(self, terms: _PackedStrings, start, paragraphs, counts):
+        self._terms = terms
+        self._start = start
+        self._paragraphs = paragraphs
+        self._counts = counts
+
+    def position(self, term: str) -> int:
+        """Row of a term in the sorted term table, or -1"""
+        row = bisect.bisect_left(self._terms, term)
+        if row < len(self._terms) and self._terms[row] == term:
+            return row
+        return -1
+
+    def get(self, term: str, default=None):
+        row = self.position(term)
+        if row < 0:
+            return default
+        start, end = self._start[row], self._start[row + 1]
+        return list(zip(self._paragraphs[start:end], self._counts[start:end]))
+
+    def __getitem__(self, term: str):
+        postings = self.get(term)
+        if postings is None:
+            raise KeyError(term)
+        return postings
+
+    def columns(self, term: str):
+        """(paragraph ids, counts) of a term, or None"""
+        row = self.position(term)
+        if row < 0:
+            return None
+        start, end = self._start[row], self._start[row + 1]
+        return self._paragraphs[start:end].tolist(), self._counts[start:end].tolist()
+
+    def frequency(self, term: str) -> int:
+        """Number of paragraphs containing a term"""
+        row = self.position(term)
+        return self._start[row + 1] - self._start[row] if row >= 0 else 0
+
+    def frequencies(self) -> Dict[str, int]:
+        """Number of paragraphs containing every term, read row by row"""
+        start = self._start
+        return {
+            term: start[row + 1] - start[row] for row, term in enumerate(self._terms)
+        }
+
+    def __contains__(self, term: str) -> bool:
+        return self.position(term) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._terms)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+class PackedVocabulary:
+    """Term -> paragraph count table of the whole pack, decoded on iteration"""
+
+    def __init__(self, terms: _PackedStrings, frequencies: memoryview):
+        self._terms = terms
+        self._frequencies = frequencies
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        return zip(self._terms, self._frequencies)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+class _PackedTermValues:
+    """Term -> float view (IDF) sharing the postings' term table"""
+
+    def __init__(self, postings: _PackedPostings, values: memoryview):
+        self._postings = postings
+        self._values = values
+
+    def __getitem__(self, term: str) -> float:
+        row = self._postings.position(term)
+        if row < 0:
+            raise KeyError(term)
+        return self._values[row]
+
+    def get(self, term: str, default=None):
+        row = self._postings.position(term)
+        return self._values[row] if row >= 0 else default
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class PackedDocumentIndex(DocumentIndex):
+    """DocumentIndex whose arrays live in a read-only memory-mapped pack
+
+    Nothing is deserialised up front: postings, IDF values and paragraphs are
+    read straight out of the mapping, so N workers share the same pages.
+    """
+
+    def __init__(self, key: str, entry: Dict, data: memoryview):
+        sections = entry["sections"]
+
+        def raw(name: str) -> memoryview:
+            offset, length = sections[name]
+            return data[offset : offset + length]
+
+        self.key = key
+        self.version = 0
+        self.source = tuple(entry["source"]) if entry["source"] else None
+        self._text_view = raw("text")
+        self._text = None
+
+        self.paragraphs = _PackedStrings(
+            raw("paragraphs"), raw("paragraph_offsets").cast("I")
+        )
+        self.display = _PackedStrings(raw("display"), raw("display_offsets").cast("I"))
+        self.lengths = raw("lengths").cast("I")
+        self.length_norms = raw("length_norms").cast("d")
+        self.average_length = entry["average_length"]
+        self.passage_chars = entry["passage_chars"]
+        self.overlap_lines = entry["overlap_lines"]
+        self.chapters = [tuple(chapter) for chapter in entry["chapters"]]
+        self.sections = [tuple(section) for section in entry["topics"]]
+
+        terms = _PackedStrings(raw("terms"), raw("term_offsets").cast("I"))
+        self.postings = _PackedPostings(
+            terms,
+            raw("postings_start").cast("I"),
+            raw("posting_paragraphs").cast("I"),
+            raw("posting_counts").cast("I"),
+        )
+        self.idf = _PackedTermValues(self.postings, raw("idf").cast("d"))
+
+    def estimated_bytes(self) -> int:
+        # Pages belong to the shared, reclaimable mapping, not to this process heap
+        return 0
+
+    @property
+    def text(self) -> str:
+        # Decoded once, only when a caller needs the full document text
+        if self._text is None:
+            self._text = str(self._text_view, "utf-8")
+        return self._text
+
+
+def load_content_pack(path: str) -> Tuple[ContentIndex, Dict]:
+    """Memory-map a pack read-only and wrap it as a ContentIndex snapshot
+
+    Also returns the table of contents, whose "vocabulary" entry is a
+    PackedVocabulary view.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise PackError(f"Cannot map content pack {path}: {e}")
+
+    if len(mapped) < _HEADER.size:
+        raise PackError(f"Content pack {path} is truncated")
+
+    magic, version, byteorder, toc_length = _HEADER.unpack_from(mapped, 0)
+    if magic != PACK_MAGIC:
+        raise PackError(f"{path} is not a content pack")
+    if version != PACK_FORMAT_VERSION:
+        raise PackError(
+            f"Content pack format {version} does not match {PACK_FORMAT_VERSION}"
+        )
+    if byteorder != (0 if sys.byteorder == "little" else 1):
+        raise PackError("Content pack was built on a host with another byte order")
+
+    toc = json.loads(mapped[_HEADER.size : _HEADER.size + toc_length])
+    data = memoryview(mapped)[_align(_HEADER.size + toc_length) :]
+
+    documents = {
+        key: PackedDocumentIndex(key, entry, data)
+        for key, entry in toc["documents"].items()
+    }
+
+    def raw(name: str) -> memoryview:
+        offset, length = toc["vocabulary"][name]
+        return data[offset : offset + length]
+
+    toc["vocabulary"] = PackedVocabulary(
+        _PackedStrings(raw("terms"), raw("term_offsets").cast("I")),
+        raw("frequencies").cast("I"),
+    )
+    return ContentIndex(documents), toc
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile content_library into a memory-mappable content pack"
+    )
+    parser.add_argument("--output", help="pack file path (default: in content_library)")
+    args = parser.parse_args()
+
+    from content_manager import ContentManager
+
+    started = time.perf_counter()
+    manager = ContentManager(use_pack=False)
+    stats = manager.write_content_pack(args.output)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"📦 Wrote {stats['path']}: {stats['documents']} documents, "
+        f"{stats['bytes'] / 1024:.1f} KB in {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
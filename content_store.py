@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class ContentStore:
+    """In-memory cache of decoded content files, revalidated by mtime and size"""
+
+    def __init__(self, revalidate_interval: float = 2.0):
+        # Seconds a cached file is trusted before its mtime/size is checked again
+        self.revalidate_interval = revalidate_interval
+
+        # path -> (mtime_ns, size, text, last_checked)
+        self._entries: Dict[str, Tuple[int, int, str, float]] = {}
+
+        # path -> ((mtime_ns, size) or None, last_checked) for recent_stamp
+        self._stamps: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.reloads = 0
+
+    def read(self, path: str) -> Optional[str]:
+        """Get the decoded text of a file, or None if it does not exist"""
+        entry = self._entries.get(path)
+        now = time.monotonic()
+
+        # Hot path: recently validated, no disk access at all
+        if entry is not None and now - entry[3] < self.revalidate_interval:
+            self.hits += 1
+            return entry[2]
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._entries.pop(path, None)
+            return None
+
+        if entry is not None and (entry[0], entry[1]) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            self._entries[path] = (entry[0], entry[1], entry[2], now)
+            self.hits += 1
+            return entry[2]
+
+        with self._lock:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, text, now)
+            self.reloads += 1
+
+        print(f"📖 Loaded {path}: {len(text)} characters")
+        return text
+
+    def stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        """Current (mtime_ns, size) of a file on disk, or None if it is missing"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def recent_stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, re-checked on disk at most once per
+        revalidation interval"""
+        entry = self._stamps.get(path)
+        now = time.monotonic()
+        if entry is not None and now - entry[1] < self.revalidate_interval:
+            return entry[0]
+
+        stamp = self.stamp(path)
+        self._stamps[path] = (stamp, now)
+        return stamp
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop one cached file (or all of them) so the next read hits disk"""
+        if path is None:
+            self._entries.clear()
+            self._stamps.clear()
+        else:
+            self._entries.pop(path, None)
+            self._stamps.pop(path, None)
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {
+            "cached_files": len(self._entries),
+            "hits": self.hits,
+            "reloads": self.reloads,
+        }
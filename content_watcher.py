@@ -0,0 +1,137 @@
+import os
+import threading
+from typing import Callable, Dict, Tuple
+
+# inotify-backed watching when watchdog is installed, polling otherwise
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+
+class ContentWatcher:
+    """Background watcher that reports changed content files in content_library"""
+
+    def __init__(
+        self,
+        root: str,
+        on_change: Callable[[str], None],
+        poll_interval: float = 2.0,
+        suffix: str = ".txt",
+    ):
+        self.root = root
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.suffix = suffix
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._observer = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def start(self):
+        """Start watching in the background"""
+        if self._thread is not None or self._observer is not None:
+            return
+
+        if WATCHDOG_AVAILABLE:
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_ChangeHandler(self), self.root, recursive=True)
+                self._observer.daemon = True
+                self._observer.start()
+                print(f"👀 Watching {self.root} for content changes (inotify)")
+                return
+            except Exception as e:
+                print(f"⚠️ File system events unavailable, polling instead: {e}")
+                self._observer = None
+
+        self._snapshot = self.scan()
+        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._thread.start()
+        print(
+            f"👀 Watching {self.root} for content changes (every {self.poll_interval}s)"
+        )
+
+    def stop(self):
+        """Stop watching"""
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Map every content file under root to its (mtime_ns, size)"""
+        snapshot = {}
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith(self.suffix):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll_loop(self):
+        """Compare directory snapshots and report files that changed"""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                current = self.scan()
+                changed = [
+                    path
+                    for path in set(current) | set(self._snapshot)
+                    if current.get(path) != self._snapshot.get(path)
+                ]
+                self._snapshot = current
+
+                for path in sorted(changed):
+                    self._notify(path)
+            except Exception as e:
+                print(f"❌ Content watcher error: {e}")
+
+    def _notify(self, path: str):
+        """Run the change callback without letting errors kill the watcher"""
+        try:
+            self.on_change(path)
+        except Exception as e:
+            print(f"❌ Error handling change to {path}: {e}")
+
+
+if WATCHDOG_AVAILABLE:
+
+    class _ChangeHandler(FileSystemEventHandler):
+        """Forward watchdog events for content files to the watcher"""
+
+        def __init__(self, watcher: ContentWatcher):
+            super().__init__()
+            self.watcher = watcher
+
+        # Only content changes: inotify also reports opens and closes, and
+        # reacting to those would make every reload's own read trigger another
+        def on_created(self, event):
+            self._forward(event)
+
+        def on_modified(self, event):
+            self._forward(event)
+
+        def on_moved(self, event):
+            self._forward(event)
+
+        def on_deleted(self, event):
+            self._forward(event)
+
+        def _forward(self, event):
+            if event.is_directory:
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path and path.endswith(self.watcher.suffix):
+                    self.watcher._notify(os.path.abspath(path))
@@ -0,0 +1,125 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+
+class CPUTaskPool:
+    """Process pool for CPU-bound answer composition with an inline fallback
+
+    Tasks run in worker processes, so a long summary does not hold the GIL
+    that every other request thread needs. At most `max_pending` tasks are
+    queued or running at once; past that, or when the pool breaks, a task
+    runs inline in the calling thread instead. A task still running after
+    `timeout` seconds is abandoned and the caller's cheap fallback returned,
+    never recomputed, and an error raised by a task propagates to the caller
+    as it would inline. With no workers, every task runs inline.
+
+    Tasks must be module-level functions with picklable arguments.
+    """
+
+    def __init__(
+        self, workers: int = 0, max_pending: Optional[int] = None, timeout: float = 2.0
+    ):
+        self.workers = max(0, workers)
+        self.max_pending = max_pending if max_pending is not None else 2 * self.workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(1, self.max_pending))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counts = {
+            "offloaded": 0,
+            "inline": 0,
+            "queue_full": 0,
+            "timeouts": 0,
+            "failures": 0,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers inherit no request threads or held locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                print(f"⚙️ Started CPU pool with {self.workers} worker processes")
+            return self._executor
+
+    def _discard_executor(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _inline(self, function: Callable, args: tuple) -> Any:
+        self._count("inline")
+        return function(*args)
+
+    def run(
+        self, function: Callable, *args, fallback: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        """Result of function(*args), computed in a worker process when possible
+
+        On timeout the result of `fallback()` (None without one) is returned;
+        only a broken pool makes the task run inline instead.
+        """
+        if self.workers == 0:
+            return self._inline(function, args)
+
+        if not self._slots.acquire(blocking=False):
+            self._count("queue_full")
+            return self._inline(function, args)
+
+        try:
+            future = self._get_executor().submit(function, *args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._slots.release()
+            print(f"⚠️ CPU pool unavailable, running inline: {e}")
+            self._count("failures")
+            self._discard_executor()
+            return self._inline(function, args)
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # A running task cannot be stopped; its slot frees when it ends
+            future.cancel()
+            print(f"⏱️ CPU task exceeded {self.timeout}s, using the fallback")
+            self._count("timeouts")
+            return fallback() if fallback is not None else None
+        except BrokenProcessPool as e:
+            print(f"⚠️ CPU pool broke, running inline: {e}")
+            self._count("failures")
+            self._discard_executor()
+            return self._inline(function, args)
+        except Exception:
+            # An error in the task (or unpicklable arguments) would only recur
+            # inline, so it is the caller's to handle
+            self._count("failures")
+            raise
+
+        self._count("offloaded")
+        return result
+
+    def shutdown(self):
+        """Stop the worker processes; later tasks start a new pool"""
+        self._discard_executor()
+
+    def get_stats(self) -> Dict:
+        """Get pool configuration and task counters"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "timeout_seconds": self.timeout,
+                "running": self._executor is not None,
+                **self._counts,
+            }
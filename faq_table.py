@@ -0,0 +1,158 @@
+import zlib
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from content_index import SECTION_PATTERN, DocumentIndex, query_terms
+
+# MinHash signature layout: 8 LSH bands of 2 rows each
+MINHASH_BANDS = 8
+MINHASH_ROWS = 2
+_PRIME = (1 << 61) - 1
+_HASH_PARAMETERS = [
+    ((2 * i + 1) * 0x9E3779B97F4A7C15 % _PRIME, (i + 1) * 0x632BE59BD9B4E019 % _PRIME)
+    for i in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+
+def normalize_question(text: str) -> str:
+    """Order-independent question key: its distinct content words, sorted"""
+    return " ".join(sorted(set(query_terms(text))))
+
+
+def shingle(normalized: str) -> FrozenSet[str]:
+    """Character trigrams of every word, so plurals and typos still overlap"""
+    shingles = set()
+    for word in normalized.split():
+        padded = f" {word} "
+        shingles.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(shingles)
+
+
+def minhash(shingles: FrozenSet[str]) -> List[int]:
+    """MinHash signature of a shingle set (deterministic across processes)"""
+    hashes = [zlib.crc32(value.encode("utf-8")) for value in shingles]
+    return [
+        min((a * value + b) % _PRIME for value in hashes) for a, b in _HASH_PARAMETERS
+    ]
+
+
+class FAQTable:
+    """Question -> answer table compiled from the institutional FAQ document
+
+    Every `**Topic**` heading of the FAQ file, plus any canonical phrasings
+    supplied, becomes a question. A question matches in O(1) either by its
+    normalized text or, for near-exact wording, through MinHash LSH buckets
+    verified with the trigram Jaccard similarity.
+    """
+
+    def __init__(
+        self,
+        document: DocumentIndex,
+        questions: Optional[Dict[str, str]] = None,
+        threshold: float = 0.6,
+    ):
+        self.version = document.version
+        self.threshold = threshold
+
+        self.answers: List[Tuple[str, str]] = []  # (section title, answer text)
+        self.exact: Dict[str, int] = {}
+        self._shingles: List[Tuple[FrozenSet[str], int]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+        answer_by_title: Dict[str, int] = {}
+        ambiguous = set()
+        for section_id, (title, _, _, _) in enumerate(document.sections):
+            key = normalize_question(title)
+            if key in answer_by_title:
+                ambiguous.add(key)  # e.g. "Primary Classes (1-5)" in two chapters
+                continue
+            answer_by_title[key] = len(self.answers)
+            self.answers.append((title, self._answer_text(document, section_id)))
+
+        for key, answer_id in answer_by_title.items():
+            if key not in ambiguous:
+                self.add_question(key, answer_id)
+
+        for question, title in (questions or {}).items():
+            answer_id = answer_by_title.get(normalize_question(title))
+            if answer_id is not None:
+                self.add_question(question, answer_id)
+
+    @staticmethod
+    def _answer_text(document: DocumentIndex, section_id: int) -> str:
+        """A section's text, including sub-headings ending in ":" that follow it"""
+        sections = document.sections
+        _, chapter_id, start, offset = sections[section_id]
+        end = (document.chapter_range(chapter_id)[1], 0)
+
+        for _, next_chapter, next_start, next_offset in sections[section_id + 1 :]:
+            if next_chapter != chapter_id or (next_start, next_offset) >= end:
+                break
+            heading = SECTION_PATTERN.match(document.display[next_start][next_offset:])
+            if not heading.group(1).strip().endswith(":"):
+                end = (next_start, next_offset)
+                break
+
+        return document.get_span((start, offset), end)
+
+    def add_question(self, question: str, answer_id: int):
+        """Register one phrasing of a question for an answer"""
+        key = normalize_question(question)
+        if not key or key in self.exact:
+            return
+        self.exact[key] = answer_id
+
+        shingles = shingle(key)
+        entry_id = len(self._shingles)
+        self._shingles.append((shingles, answer_id))
+        for band, rows in enumerate(self._bands(shingles)):
+            self._buckets.setdefault((band, rows), []).append(entry_id)
+
+    def _bands(self, shingles: FrozenSet[str]) -> List[Tuple[int, ...]]:
+        signature = minhash(shingles)
+        return [
+            tuple(signature[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS])
+            for band in range(MINHASH_BANDS)
+        ]
+
+    def lookup(self, query: str) -> Optional[Dict]:
+        """Answer for a question asked exactly or near-exactly, or None"""
+        key = normalize_question(query)
+        if not key:
+            return None
+
+        answer_id = self.exact.get(key)
+        if answer_id is not None:
+            return self._result(answer_id, "exact", 1.0)
+
+        shingles = shingle(key)
+        candidates = set()
+        for band, rows in enumerate(self._bands(shingles)):
+            candidates.update(self._buckets.get((band, rows), ()))
+
+        best = None
+        for entry_id in candidates:
+            entry_shingles, answer_id = self._shingles[entry_id]
+            similarity = len(shingles & entry_shingles) / len(shingles | entry_shingles)
+            if similarity >= self.threshold and (best is None or similarity > best[0]):
+                best = (similarity, answer_id)
+
+        if best is None:
+            return None
+        return self._result(best[1], "near", round(best[0], 3))
+
+    def _result(self, answer_id: int, match: str, similarity: float) -> Dict:
+        title, answer = self.answers[answer_id]
+        return {
+            "title": title,
+            "answer": answer,
+            "match": match,
+            "similarity": similarity,
+        }
+
+    def get_stats(self) -> Dict:
+        """Get table size"""
+        return {
+            "answers": len(self.answers),
+            "questions": len(self.exact),
+            "buckets": len(self._buckets),
+        }
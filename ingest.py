@@ -0,0 +1,243 @@
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from typing import Dict, Iterator, List, Optional
+
+# Peak RSS reporting (not available on Windows)
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+PLAIN_CHAPTER_PATTERN = re.compile(
+    r"^(?:chapter|unit|lesson)\s+(\d+|[ivxlc]+)\b[\s:.\-–]*(.*)$", re.IGNORECASE
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def iter_paragraphs(lines: Iterator[str], max_paragraph_chars: int = 20000):
+    """Stream (kind, text) blocks from source lines in the content file format
+
+    kind is "title", "chapter" or "paragraph". Markdown "##" headings and
+    plain "Chapter N" lines become "## ..." chapters; deeper headings become
+    "**Topic**" lines joined to the paragraph that follows. Text already in
+    the content file format passes through unchanged.
+    """
+    buffer: List[str] = []
+    size = 0
+    pending_heading: Optional[str] = None
+
+    def flush():
+        nonlocal buffer, size, pending_heading
+        if buffer:
+            text = "\n".join(buffer)
+            if pending_heading is not None:
+                text = f"{pending_heading}\n{text}"
+                pending_heading = None
+            buffer, size = [], 0
+            return text
+        return None
+
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n").rstrip()
+
+        if not line.strip():
+            paragraph = flush()
+            if paragraph is not None:
+                yield "paragraph", paragraph
+            continue
+
+        markdown = MARKDOWN_HEADING_PATTERN.match(line)
+        plain_chapter = PLAIN_CHAPTER_PATTERN.match(line.strip())
+
+        if markdown or plain_chapter:
+            paragraph = flush()
+            if paragraph is not None:
+                yield "paragraph", paragraph
+
+            level = len(markdown.group(1)) if markdown else 2
+            if pending_heading is not None and level <= 2:
+                yield "paragraph", pending_heading
+                pending_heading = None
+
+            title = markdown.group(2) if markdown else line.strip()
+            if level == 1:
+                yield "title", f"# {title}"
+            elif level == 2:
+                yield "chapter", f"## {title}"
+            elif pending_heading is None:
+                pending_heading = f"**{title}**"
+            else:
+                # "### Rise of ..." directly followed by "#### Buddhism" stays
+                # together as the head of one paragraph
+                pending_heading = f"{pending_heading}\n**{title}**"
+            continue
+
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= max_paragraph_chars:
+            yield "paragraph", flush()
+
+    paragraph = flush()
+    if paragraph is not None:
+        yield "paragraph", paragraph
+    if pending_heading is not None:
+        yield "paragraph", pending_heading
+
+
+def paragraph_fingerprint(text: str) -> bytes:
+    """Digest of a paragraph ignoring case and whitespace differences"""
+    normalized = WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+
+
+def ingest_file(
+    source: str,
+    destination: str,
+    min_duplicate_chars: int = 40,
+    overwrite: bool = False,
+) -> Dict:
+    """Convert one plain-text/markdown source into a content file, streaming
+
+    Repeated paragraphs (at least min_duplicate_chars long, so short
+    headings are kept) are written once. Only 8-byte digests are kept in
+    memory, never the text itself. An existing destination is only replaced
+    with `overwrite`; otherwise FileExistsError is raised.
+    """
+    if os.path.exists(destination) and not overwrite:
+        raise FileExistsError(f"{destination} already exists")
+
+    seen = set()
+    stats = {
+        "source": source,
+        "path": destination,
+        "bytes": os.path.getsize(source),
+        "paragraphs": 0,
+        "duplicates": 0,
+        "chapters": 0,
+    }
+
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    temp_path = destination + ".tmp"
+    with open(source, "r", encoding="utf-8", errors="replace") as reader, open(
+        temp_path, "w", encoding="utf-8"
+    ) as writer:
+        for kind, text in iter_paragraphs(reader):
+            if kind == "paragraph" and len(text) >= min_duplicate_chars:
+                fingerprint = paragraph_fingerprint(text)
+                if fingerprint in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(fingerprint)
+
+            if kind == "chapter":
+                stats["chapters"] += 1
+            stats["paragraphs"] += 1
+            writer.write(text + "\n\n")
+
+    os.replace(temp_path, destination)
+    return stats
+
+
+def subject_filename(source: str) -> str:
+    """Content file name for a source: "Class 6 Science.md" -> "class-6-science-content.txt" """
+    stem = os.path.splitext(os.path.basename(source))[0].lower()
+    stem = re.sub(r"[^a-z0-9]+", "-", stem).strip("-") or "subject"
+    if not stem.endswith("-content"):
+        stem += "-content"
+    return stem + ".txt"
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, if the platform reports it"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Stream textbooks into content_library/subjects and check that they "
+            "index. A running server's content watcher picks the new files up on "
+            "its own; use --update-pack to also rebuild the content pack for the "
+            "next start-up."
+        )
+    )
+    parser.add_argument("sources", nargs="+", help="plain-text or markdown files")
+    parser.add_argument(
+        "--dest",
+        default="",
+        help="folder under content_library/subjects, e.g. grade-6/cbse",
+    )
+    parser.add_argument(
+        "--update-pack",
+        action="store_true",
+        help="rewrite the content pack afterwards (unchanged documents are reused)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="replace subject files that already exist",
+    )
+    args = parser.parse_args()
+
+    from content_manager import ContentManager
+
+    manager = ContentManager()
+    destination_dir = os.path.join(manager.subjects_dir, args.dest)
+
+    started = time.perf_counter()
+    total_bytes = 0
+    ingested = 0
+    for source in args.sources:
+        destination = os.path.join(destination_dir, subject_filename(source))
+        file_started = time.perf_counter()
+        try:
+            stats = ingest_file(source, destination, overwrite=args.force)
+        except FileExistsError:
+            print(
+                f"⚠️ Skipped {source}: {destination} already exists "
+                f"(use --force to replace it)"
+            )
+            continue
+        elapsed = time.perf_counter() - file_started
+        total_bytes += stats["bytes"]
+        ingested += 1
+
+        # Index just this file to check it (this in-memory index is not kept;
+        # the server's watcher and --update-pack do that)
+        manager.reload_file(stats["path"])
+        key = manager.get_document_key(stats["path"])
+        document = manager.get_document(key) if key else None
+
+        print(
+            f"📥 {source} -> {stats['path']} ({key}): {stats['paragraphs']} paragraphs, "
+            f"{stats['chapters']} chapters, {stats['duplicates']} duplicates dropped, "
+            f"{len(document) if document else 0} indexed, "
+            f"{stats['bytes'] / (1024 * 1024) / max(elapsed, 1e-9):.1f} MB/s"
+        )
+
+    elapsed = time.perf_counter() - started
+    peak = peak_rss_mb()
+    print(
+        f"✅ Ingested {ingested} of {len(args.sources)} files, {total_bytes / (1024 * 1024):.1f} MB "
+        f"in {elapsed:.2f}s ({total_bytes / (1024 * 1024) / max(elapsed, 1e-9):.1f} MB/s)"
+        + (f", peak RSS {peak:.0f} MB" if peak is not None else "")
+    )
+
+    if args.update_pack:
+        pack = manager.write_content_pack()
+        print(f"📦 Updated {pack['path']}: {pack['bytes'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
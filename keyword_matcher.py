@@ -0,0 +1,99 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+# Inflections that still count as the keyword ("rules" -> "rule", "पुस्तकें" ->
+# "पुस्तक"), while any other letters after it make a different word ("ruler")
+KEYWORD_SUFFIXES = ("s", "es", "ें", "ों", "ओं", "एं", "एँ")
+
+
+def is_word_char(char: str) -> bool:
+    """Letters, digits and Indic vowel signs (which str.isalnum() rejects)"""
+    return char.isalnum() or char == "_" or "\u0900" <= char <= "\u0d7f"
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over labelled keyword lists
+
+    All keywords are found in one pass over the text, and only matches that
+    start and end on word boundaries count, so "rule" does not fire inside
+    "ruler" and "lab" not inside "syllabus".
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        self.labels: List[str] = list(keywords)
+
+        # Trie: per-state transitions and (keyword id) outputs
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        self.keywords: List[Tuple[str, int]] = []  # (keyword, label id)
+        for label_id, label in enumerate(self.labels):
+            for keyword in keywords[label]:
+                keyword = keyword.lower()
+                state = 0
+                for char in keyword:
+                    if char not in transitions[state]:
+                        transitions[state][char] = len(transitions)
+                        transitions.append({})
+                        outputs.append([])
+                    state = transitions[state][char]
+                outputs[state].append(len(self.keywords))
+                self.keywords.append((keyword, label_id))
+
+        # Breadth-first failure links, folded into complete transition tables
+        # so matching never walks back along failure links
+        fail = [0] * len(transitions)
+        self._delta: List[Dict[str, int]] = [dict(transitions[0])]
+        self._delta.extend({} for _ in range(len(transitions) - 1))
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            delta = dict(self._delta[fail[state]])
+            for char, child in transitions[state].items():
+                fail[child] = self._delta[fail[state]].get(char, 0)
+                delta[char] = child
+                queue.append(child)
+            self._delta[state] = delta
+
+        self._outputs: List[Tuple[Tuple[int, int], ...]] = [
+            tuple((keyword_id, len(self.keywords[keyword_id][0])) for keyword_id in ids)
+            for ids in outputs
+        ]
+
+    def _ends_word(self, text: str, end: int) -> bool:
+        if end == len(text) or not is_word_char(text[end]):
+            return True
+        for suffix in KEYWORD_SUFFIXES:
+            after = end + len(suffix)
+            if text.startswith(suffix, end) and (
+                after == len(text) or not is_word_char(text[after])
+            ):
+                return True
+        return False
+
+    def find(self, text: str) -> List[int]:
+        """Ids of the distinct keywords found as whole words in the text"""
+        text = text.lower()
+        delta = self._delta
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for position, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for keyword_id, length in outputs[state]:
+                    start = position - length + 1
+                    if (
+                        keyword_id not in found
+                        and (start == 0 or not is_word_char(text[start - 1]))
+                        and self._ends_word(text, position + 1)
+                    ):
+                        found.add(keyword_id)
+        return list(found)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords of every label found in the text"""
+        scores = {label: 0 for label in self.labels}
+        for keyword_id in self.find(text):
+            scores[self.labels[self.keywords[keyword_id][1]]] += 1
+        return scores
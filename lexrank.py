@@ -0,0 +1,217 @@
+import math
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from content_index import split_sentences, tokenize
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Same similarity cutoff as sumy's LexRankSummarizer
+SIMILARITY_THRESHOLD = 0.1
+
+# Headings and fragments are too short to stand alone in a summary
+MIN_SENTENCE_TERMS = 4
+
+# MMR trade-off: weight of query relevance against redundancy with the
+# sentences already picked
+MMR_RELEVANCE_WEIGHT = 0.7
+
+# Relevance a sentence gains from the `**Topic**` heading above it, relative
+# to its own text: a section titled with the query term is about it
+HEADING_RELEVANCE_WEIGHT = 1.0
+
+# Share of the query's IDF weight a sentence and its heading must cover
+# between them, so one common query word is not enough to be picked
+MIN_QUERY_COVERAGE = 0.5
+
+
+def term_counts(sentence: str) -> Dict[str, int]:
+    """Term frequencies of a sentence under the index tokenizer"""
+    counts: Dict[str, int] = {}
+    for term in tokenize(sentence):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def sentence_idf(vectors: List[Dict[str, int]]) -> Dict[str, float]:
+    """sumy's IDF over the sentences themselves: log(N / (1 + df))"""
+    frequencies: Dict[str, int] = {}
+    for counts in vectors:
+        for term in counts:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    return {
+        term: math.log(len(vectors) / (1 + frequency))
+        for term, frequency in frequencies.items()
+    }
+
+
+def sentence_matrix(
+    vectors: List[Dict[str, int]], idf: Mapping[str, float]
+) -> Tuple["np.ndarray", Dict[str, int]]:
+    """Unit-length TF-IDF rows (TF is count over the sentence's highest count)
+    and the term -> column vocabulary"""
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for LexRank")
+
+    vocabulary: Dict[str, int] = {}
+    rows, columns, values = [], [], []
+    for row, counts in enumerate(vectors):
+        if not counts:
+            continue
+        top = max(counts.values())
+        for term, count in counts.items():
+            rows.append(row)
+            columns.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(count / top * idf.get(term, 0.0))
+
+    weights = np.zeros((len(vectors), max(1, len(vocabulary))))
+    weights[rows, columns] = values
+    norms = np.linalg.norm(weights, axis=1)
+    norms[norms == 0] = 1.0
+    weights /= norms[:, None]
+    return weights, vocabulary
+
+
+def lexrank_scores(
+    vectors: List[Dict[str, int]],
+    idf: Mapping[str, float],
+    threshold: float = SIMILARITY_THRESHOLD,
+    epsilon: float = 1e-4,
+    max_iterations: int = 100,
+) -> "np.ndarray":
+    """LexRank centrality of every sentence
+
+    One matrix product of the TF-IDF rows gives their cosine similarities,
+    and power iteration over the thresholded, degree-normalized graph the
+    scores.
+    """
+    weights, _ = sentence_matrix(vectors, idf)
+    adjacency = (weights @ weights.T > threshold).astype(float)
+    degrees = adjacency.sum(axis=1)
+    degrees[degrees == 0] = 1.0
+    transition = (adjacency / degrees[:, None]).T
+
+    scores = np.full(len(vectors), 1.0 / len(vectors))
+    for _ in range(max_iterations):
+        updated = transition @ scores
+        change = np.linalg.norm(updated - scores)
+        scores = updated
+        if change < epsilon:
+            break
+    return scores
+
+
+def summarize(
+    vectors: List[Dict[str, int]],
+    idf: Optional[Mapping[str, float]] = None,
+    count: int = 3,
+) -> List[int]:
+    """Indices of the `count` most central sentences, in document order
+
+    `idf` defaults to the sentences' own, as in sumy: centrality is about
+    which sentences share the passage's terms, which a document-wide table
+    skews towards its rare words (only 59% of the top three sentences then
+    match sumy's).
+    """
+    candidates = [
+        i
+        for i, counts in enumerate(vectors)
+        if sum(counts.values()) >= MIN_SENTENCE_TERMS
+    ]
+    if len(candidates) <= count:
+        return candidates
+
+    candidate_vectors = [vectors[i] for i in candidates]
+    if idf is None:
+        idf = sentence_idf(candidate_vectors)
+    scores = lexrank_scores(candidate_vectors, idf)
+    best = sorted(np.argsort(-scores, kind="stable")[:count])
+    return [candidates[i] for i in best]
+
+
+def select_relevant(
+    query_terms: List[str],
+    vectors: List[Dict[str, int]],
+    idf: Mapping[str, float],
+    count: int = 3,
+    relevance_weight: float = MMR_RELEVANCE_WEIGHT,
+    headings: Optional[List[Dict[str, int]]] = None,
+) -> List[int]:
+    """Indices of up to `count` answer sentences by maximal marginal
+    relevance, in document order
+
+    Each pick maximizes relevance (cosine to the IDF-weighted query terms)
+    minus redundancy (highest cosine to a sentence already picked). The
+    heading above each sentence, if given as term counts, adds its own
+    cosine to the query at HEADING_RELEVANCE_WEIGHT, so a definition under
+    `**Photosynthesis**` is relevant without repeating the word. Only
+    sentences covering MIN_QUERY_COVERAGE of the query's weight with their
+    heading are picked (any relevant ones if none do), so fewer than
+    `count` may come back; with none at all, LexRank centrality decides.
+    """
+    candidates = [
+        i
+        for i, counts in enumerate(vectors)
+        if sum(counts.values()) >= MIN_SENTENCE_TERMS
+    ]
+    if not candidates:
+        return []
+
+    def query_cosines(weights: "np.ndarray", vocabulary: Dict[str, int]):
+        query = np.zeros(weights.shape[1])
+        for term in query_terms:
+            column = vocabulary.get(term)
+            if column is not None:
+                query[column] += idf.get(term, 0.0)
+        norm = np.linalg.norm(query)
+        return weights @ (query / norm) if norm else np.zeros(len(weights))
+
+    weights, vocabulary = sentence_matrix([vectors[i] for i in candidates], idf)
+    relevance = query_cosines(weights, vocabulary)
+    if headings is not None:
+        relevance = relevance + HEADING_RELEVANCE_WEIGHT * query_cosines(
+            *sentence_matrix([headings[i] for i in candidates], idf)
+        )
+    if not relevance.any():
+        return summarize(vectors, count=count)
+
+    terms = set(query_terms)
+    total = sum(idf.get(term, 0.0) for term in terms)
+    coverage = np.array(
+        [
+            sum(
+                idf.get(term, 0.0)
+                for term in terms
+                if term in vectors[i] or (headings is not None and term in headings[i])
+            )
+            for i in candidates
+        ]
+    )
+    pool = np.flatnonzero((relevance > 0) & (coverage >= MIN_QUERY_COVERAGE * total))
+    if not len(pool):
+        pool = np.flatnonzero(relevance > 0)
+    relevance = relevance[pool]
+    similarity = weights[pool] @ weights[pool].T
+
+    selected: List[int] = []
+    redundancy = np.zeros(len(pool))
+    for _ in range(min(count, len(pool))):
+        scores = relevance_weight * relevance - (1 - relevance_weight) * redundancy
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        redundancy = np.maximum(redundancy, similarity[best])
+    return sorted(candidates[pool[i]] for i in selected)
+
+
+def summarize_text(
+    text: str, idf: Optional[Mapping[str, float]] = None, count: int = 3
+) -> str:
+    """Most central sentences of a plain text, joined"""
+    sentences = split_sentences(text)
+    chosen = summarize([term_counts(s) for s in sentences], idf, count)
+    return " ".join(sentences[i] for i in chosen)
@@ -0,0 +1,102 @@
+import re
+from typing import Dict, List, Optional, Set
+
+# Word characters plus the Indic blocks (Devanagari .. Malayalam), whose vowel
+# signs and viramas are combining marks that a plain \w+ would split on.
+# The danda and double danda (sentence punctuation) are left out.
+NATIVE_TOKEN_PATTERN = re.compile(r"[\w\u0900-\u0963\u0966-\u0d7f]+")
+INDIC_SCRIPT_PATTERN = re.compile(r"[\u0900-\u0d7f]")
+
+# Question and function words in Hindi and Marathi that carry no topic
+NATIVE_STOPWORDS = frozenset("""
+    क्या है हैं था थी थे का की के को में से पर और या एक यह वह ये वो इस उस
+    कैसे कौन क्यों कब कहाँ कहां कितना कितनी कितने मुझे मेरा मेरी हमें हम आप
+    तुम बताइए बताओ बताएं समझाइए समझाओ कृपया होता होती होते करें करते करना
+    भी तो ही जी आहे काय कसे कुठे केव्हा कोण माझे तुझे
+    """.split())
+
+
+def native_tokenize(text: str) -> List[str]:
+    """Split text into lowercase tokens without breaking Indic words apart"""
+    return NATIVE_TOKEN_PATTERN.findall(text.lower())
+
+
+class NativeTermMap:
+    """Native-script words and phrases mapped to the English terms of the index
+
+    Lets a query written in an Indian script be answered from the English
+    content directly, without a round trip to a translation API.
+    """
+
+    def __init__(self, max_phrase_words: int = 3):
+        self.max_phrase_words = max_phrase_words
+
+        # Native phrase (space-joined tokens) -> English expansion terms
+        self.terms: Dict[str, Set[str]] = {}
+
+    def add(self, native: str, english: str):
+        """Map one native word or phrase to an English word or phrase"""
+        key = " ".join(native_tokenize(native))
+        words = native_tokenize(english)
+        if not key or not words or INDIC_SCRIPT_PATTERN.search(english):
+            return
+        if key in NATIVE_STOPWORDS:
+            return  # "है" -> is/have/has would only add noise
+        self.terms.setdefault(key, set()).update(words)
+
+    def add_dictionary(self, dictionaries: Dict[str, Dict[str, str]]):
+        """Seed from "en_to_xx" / "xx_to_en" translation dictionaries"""
+        for pair, dictionary in dictionaries.items():
+            source, _, target = pair.partition("_to_")
+            for original, translation in dictionary.items():
+                if source == "en" and target != "en":
+                    self.add(translation, original)
+                elif target == "en" and source != "en":
+                    self.add(original, translation)
+
+    def add_terms(self, meanings: Dict[str, str]):
+        """Seed from a plain native -> English glossary"""
+        for native, english in meanings.items():
+            self.add(native, english)
+
+    def translate_query(self, text: str) -> Optional[str]:
+        """English search terms for a native-script query, or None if not covered
+
+        Phrases are matched longest first. The query only counts as covered
+        when every native word is either a known term or a stopword; anything
+        else still needs a real translation.
+        """
+        tokens = native_tokenize(text)
+        if not tokens or not self.terms:
+            return None
+
+        english: List[str] = []
+        position = 0
+        while position < len(tokens):
+            for size in range(
+                min(self.max_phrase_words, len(tokens) - position), 0, -1
+            ):
+                expansion = self.terms.get(" ".join(tokens[position : position + size]))
+                if expansion is not None:
+                    english.extend(sorted(expansion))
+                    position += size
+                    break
+            else:
+                token = tokens[position]
+                if INDIC_SCRIPT_PATTERN.search(token):
+                    if token not in NATIVE_STOPWORDS:
+                        return None
+                else:
+                    english.append(token)  # Latin words and numbers pass through
+                position += 1
+
+        return " ".join(english) if english else None
+
+    def get_stats(self) -> Dict:
+        """Get glossary size"""
+        return {
+            "native_terms": len(self.terms),
+            "english_terms": (
+                len(set().union(*self.terms.values())) if self.terms else 0
+            ),
+        }
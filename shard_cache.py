@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+
+class ShardCache:
+    """LRU bookkeeping of loaded document shards under a memory budget
+
+    Only sizes are tracked here; the caller drops the evicted shards from its
+    index. The shard just used is never evicted, even if it alone is over budget.
+    """
+
+    def __init__(self, memory_budget: int = 128 * 1024 * 1024):
+        self.memory_budget = memory_budget
+
+        # key -> estimated bytes, least recently used first
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+        self.loads = 0
+        self.evictions = 0
+
+    def touch(self, key: str, size: int) -> List[str]:
+        """Mark a shard as used, returning the keys that must be evicted"""
+        with self._lock:
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+                return []
+
+            self._sizes[key] = size
+            self.total_bytes += size
+            self.loads += 1
+
+            evicted = []
+            while self.total_bytes > self.memory_budget and len(self._sizes) > 1:
+                cold_key, cold_size = self._sizes.popitem(last=False)
+                self.total_bytes -= cold_size
+                evicted.append(cold_key)
+            self.evictions += len(evicted)
+            return evicted
+
+    def discard(self, key: str):
+        """Forget a shard that was dropped for another reason (edited or deleted)"""
+        with self._lock:
+            size = self._sizes.pop(key, None)
+            if size is not None:
+                self.total_bytes -= size
+
+    def get_stats(self) -> Dict:
+        """Get residency and eviction counters"""
+        return {
+            "loaded_shards": len(self._sizes),
+            "estimated_bytes": self.total_bytes,
+            "memory_budget": self.memory_budget,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
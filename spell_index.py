@@ -0,0 +1,255 @@
+import heapq
+import os
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from content_index import STOPWORDS
+
+# Bundled list of common English words; a term found here (or an inflection
+# of one) is a real word the library lacks, never a typo to rewrite
+ENGLISH_WORDS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "english_words.txt"
+)
+
+# Inflected forms tried before any edit-distance match ("cells" -> "cell")
+INFLECTIONS = (
+    ("ies", "y"),
+    ("es", ""),
+    ("s", ""),
+    ("ing", ""),
+    ("ing", "e"),
+    ("ed", ""),
+    ("ed", "e"),
+    ("", "s"),
+    ("", "es"),
+)
+
+# Never correction targets: an unknown word one edit away from one of these
+# ("comet" -> "come") is far more likely a real word than a typo
+COMMON_WORDS = STOPWORDS | frozenset("""
+    also back came come does done each even ever good have just keep kind
+    know like look made make many more most much must need once only other
+    over part same said says seem such take than them then they thing time
+    took used very want well went were will with work year
+    """.split())
+
+
+_english_words: Optional[FrozenSet[str]] = None
+_english_words_lock = threading.Lock()
+
+
+def english_words() -> FrozenSet[str]:
+    """The bundled English word list, read on first use"""
+    global _english_words
+    with _english_words_lock:
+        if _english_words is None:
+            try:
+                with open(ENGLISH_WORDS_PATH, "r", encoding="utf-8") as f:
+                    _english_words = frozenset(
+                        line.strip()
+                        for line in f
+                        if line.strip() and not line.startswith("#")
+                    )
+            except OSError as e:
+                print(f"⚠️ English word list not available: {e}")
+                _english_words = frozenset()
+        return _english_words
+
+
+def is_english_word(term: str) -> bool:
+    """Whether a term is a listed English word or a regular inflection of one"""
+    words = english_words()
+    if term in words:
+        return True
+    return any(
+        term.endswith(suffix)
+        and len(term) - len(suffix) >= 3
+        and term[: len(term) - len(suffix)] + replacement in words
+        for suffix, replacement in INFLECTIONS
+        if suffix
+    )
+
+
+def trigrams(word: str) -> List[str]:
+    """Distinct character trigrams of a word padded with one space each side"""
+    padded = f" {word} "
+    return list({padded[i : i + 3] for i in range(len(padded) - 2)})
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class TrigramSpellIndex:
+    """Character-trigram index over the content vocabulary for query correction
+
+    A misspelt term is only compared against the few vocabulary words that
+    share the most trigrams with it, never against the whole vocabulary.
+    Corrections are conservative, since searching for the wrong word makes
+    the answer wrong rather than empty: English words are never corrected,
+    a correction keeps the first letter and must be close by both trigram
+    overlap and edit distance, and it is added next to the original term
+    rather than replacing it.
+    """
+
+    def __init__(
+        self,
+        frequencies: Dict[str, int],
+        min_length: int = 5,
+        max_distance: int = 2,
+        max_candidates: int = 8,
+        min_dice: float = 0.5,
+    ):
+        self.min_length = min_length
+        self.max_distance = max_distance
+        self.max_candidates = max_candidates
+        self.min_dice = min_dice
+
+        # Word -> number of paragraphs it occurs in (the vocabulary, and the
+        # tie-breaker between candidates); words that drop out keep their id
+        self.frequencies: Dict[str, int] = {}
+        self.words: List[str] = []
+        self.word_ids: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self._corrections: Dict[str, Optional[str]] = {}
+        self.update({}, frequencies)
+
+    @property
+    def vocabulary(self):
+        return self.frequencies.keys()
+
+    def update(self, removed: Dict[str, int], added: Dict[str, int]):
+        """Apply one document's change: subtract its old paragraph counts and
+        add the new ones, indexing the trigrams of new words only"""
+        with self._lock:
+            frequencies = self.frequencies
+            for term, count in removed.items():
+                if term in frequencies:
+                    if frequencies[term] > count:
+                        frequencies[term] -= count
+                    else:
+                        del frequencies[term]
+            for term, count in added.items():
+                if not term.isalpha():
+                    continue
+                if term not in self.word_ids:
+                    word_id = len(self.words)
+                    self.word_ids[term] = word_id
+                    self.words.append(term)
+                    for gram in trigrams(term):
+                        self.postings.setdefault(gram, []).append(word_id)
+                frequencies[term] = frequencies.get(term, 0) + count
+            self._corrections = {}
+
+    def inflection(self, term: str) -> Optional[str]:
+        """Vocabulary word that differs from a term only by inflection"""
+        for suffix, replacement in INFLECTIONS:
+            if term.endswith(suffix) and len(term) - len(suffix) >= 3:
+                word = term[: len(term) - len(suffix)] + replacement
+                if word != term and word in self.vocabulary:
+                    return word
+        return None
+
+    def correct(self, term: str) -> Optional[str]:
+        """Closest vocabulary word for an unknown term, or None to leave it alone"""
+        if term in self.vocabulary or term in STOPWORDS or not term.isalpha():
+            return None
+
+        # Replaced wholesale by update(), so read through one reference
+        corrections = self._corrections
+        if term in corrections:
+            return corrections[term]
+
+        # Inflections are safe for any word ("robots" -> "robot"); edits only
+        # for longer words that are no English word ("battery" is not a
+        # misspelt "matter", just absent from the library)
+        correction = self.inflection(term)
+        if (
+            correction is None
+            and len(term) >= self.min_length
+            and not is_english_word(term)
+        ):
+            correction = self.closest(term)
+        if len(corrections) < 10000:
+            corrections[term] = correction
+        return correction
+
+    def closest(self, term: str) -> Optional[str]:
+        """Nearest vocabulary word by edit distance among trigram candidates"""
+        grams = trigrams(term)
+        overlaps: Dict[int, int] = {}
+        for gram in grams:
+            for word_id in self.postings.get(gram, ()):
+                overlaps[word_id] = overlaps.get(word_id, 0) + 1
+
+        # Shortlist by trigram overlap (Dice coefficient), then verify exactly
+        def dice(item: Tuple[int, int]) -> float:
+            word_id, shared = item
+            return 2 * shared / (len(grams) + len(self.words[word_id]))
+
+        # Ties go to the closer trigram match ("noun" -> "nouns", not "non"),
+        # then to the more common word. Candidates must keep the first letter
+        # ("skool" is not "cool") and words up to 8 letters get one edit only
+        limit = 1 if len(term) <= 8 else self.max_distance
+
+        best = None
+        for item in heapq.nlargest(self.max_candidates, overlaps.items(), dice):
+            word_id = item[0]
+            word = self.words[word_id]
+            frequency = self.frequencies.get(word, 0)
+            if (
+                not frequency
+                or word in COMMON_WORDS
+                or word[0] != term[0]
+                or dice(item) < self.min_dice
+            ):
+                continue
+            distance = edit_distance(term, word, limit)
+            if distance > limit:
+                continue
+            rank = (distance, -dice(item), -frequency, word)
+            if best is None or rank < best:
+                best = rank
+
+        return best[3] if best is not None else None
+
+    def expand_terms(self, terms: Iterable[str]) -> List[str]:
+        """Query terms with the correction of each misspelt one added after it
+
+        The original term stays in the query, so a wrong guess only adds a
+        term to match instead of replacing the one the user typed.
+        """
+        expanded: List[str] = []
+        for term in terms:
+            expanded.append(term)
+            correction = self.correct(term)
+            if correction is not None and correction not in expanded:
+                expanded.append(correction)
+        return expanded
+
+    def get_stats(self) -> Dict:
+        """Get index size"""
+        return {
+            "words": len(self.frequencies),
+            "trigrams": len(self.postings),
+            "cached_corrections": len(self._corrections),
+        }
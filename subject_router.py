@@ -0,0 +1,228 @@
+import argparse
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from content_index import STOPWORDS, DocumentIndex
+
+ROUTER_FILENAME = "subject_router.json"
+ROUTER_FORMAT_VERSION = 1
+
+
+def count_terms(document: DocumentIndex) -> Tuple[int, Dict[str, int]]:
+    """Total and per-term occurrence counts of a document (stopwords excluded)"""
+    total = 0
+    counts = {}
+    for term in document.postings:
+        if term in STOPWORDS:
+            continue
+        count = sum(document.postings.columns(term)[1])
+        counts[term] = count
+        total += count
+    return total, counts
+
+
+class SubjectRouter:
+    """Multinomial naive-Bayes subject classifier trained from the content library
+
+    Each subject's term counts come straight from its index postings, so
+    training needs no labelled questions. Only terms that occur are stored;
+    a subject's score for an unseen term is its smoothing floor.
+    """
+
+    def __init__(
+        self,
+        subjects: List[str],
+        totals: List[int],
+        term_counts: Dict[str, List[Tuple[int, int]]],
+        sources: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+        alpha: float = 0.1,
+    ):
+        self.subjects = subjects
+        self.totals = totals
+        self.term_counts = term_counts  # term -> [(subject id, count)]
+        self.sources = sources or {}
+        self.alpha = alpha
+
+        # log P(term | subject) = log((count + alpha) / (total + alpha * |V|))
+        vocabulary = len(term_counts)
+        self._denominators = [math.log(total + alpha * vocabulary) for total in totals]
+        self._floors = [
+            math.log(alpha) - denominator for denominator in self._denominators
+        ]
+
+    @classmethod
+    def train(
+        cls,
+        documents: Dict[str, DocumentIndex],
+        sources: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+    ) -> "SubjectRouter":
+        """Count every subject document's terms (stopwords excluded)"""
+        subjects = list(documents)
+        totals = []
+        term_counts: Dict[str, List[Tuple[int, int]]] = {}
+        for subject_id, subject in enumerate(subjects):
+            total, counts = count_terms(documents[subject])
+            for term, count in counts.items():
+                term_counts.setdefault(term, []).append((subject_id, count))
+            totals.append(total)
+        return cls(subjects, totals, term_counts, sources)
+
+    def with_subject(
+        self,
+        subject: str,
+        document: DocumentIndex,
+        source: Optional[Tuple[int, int]] = None,
+    ) -> "SubjectRouter":
+        """Copy of the router with one subject (re)counted from its document"""
+        subjects = list(self.subjects)
+        totals = list(self.totals)
+        if subject in subjects:
+            subject_id = subjects.index(subject)
+        else:
+            subject_id = len(subjects)
+            subjects.append(subject)
+            totals.append(0)
+
+        term_counts = {}
+        for term, entries in self.term_counts.items():
+            kept = [entry for entry in entries if entry[0] != subject_id]
+            if kept:
+                term_counts[term] = kept
+        totals[subject_id], counts = count_terms(document)
+        for term, count in counts.items():
+            term_counts.setdefault(term, []).append((subject_id, count))
+
+        sources = dict(self.sources)
+        sources[subject] = source
+        return SubjectRouter(subjects, totals, term_counts, sources, self.alpha)
+
+    def without_subject(self, subject: str) -> "SubjectRouter":
+        """Copy of the router that no longer knows a removed subject"""
+        if subject not in self.subjects:
+            return self
+        removed = self.subjects.index(subject)
+        subjects = self.subjects[:removed] + self.subjects[removed + 1 :]
+        totals = self.totals[:removed] + self.totals[removed + 1 :]
+
+        term_counts = {}
+        for term, entries in self.term_counts.items():
+            kept = [
+                (subject_id - (subject_id > removed), count)
+                for subject_id, count in entries
+                if subject_id != removed
+            ]
+            if kept:
+                term_counts[term] = kept
+
+        sources = dict(self.sources)
+        sources.pop(subject, None)
+        return SubjectRouter(subjects, totals, term_counts, sources, self.alpha)
+
+    def rank(self, terms: List[str]) -> List[Tuple[str, float]]:
+        """Subjects with their posterior probability, most likely first
+
+        Empty when none of the terms occur in the library, i.e. there is no
+        evidence to route on.
+        """
+        known = [term for term in terms if term in self.term_counts]
+        if not known or not self.subjects:
+            return []
+
+        # Uniform prior: a bigger textbook is not a likelier question topic
+        scores = [floor * len(known) for floor in self._floors]
+        for term in known:
+            for subject_id, count in self.term_counts[term]:
+                scores[subject_id] += (
+                    math.log(count + self.alpha)
+                    - self._denominators[subject_id]
+                    - self._floors[subject_id]
+                )
+
+        best = max(scores)
+        weights = [math.exp(score - best) for score in scores]
+        total = sum(weights)
+        return sorted(
+            (
+                (subject, weight / total)
+                for subject, weight in zip(self.subjects, weights)
+            ),
+            key=lambda item: -item[1],
+        )
+
+    def save(self, path: str):
+        """Write the router as JSON next to the content it was trained on"""
+        data = {
+            "format": ROUTER_FORMAT_VERSION,
+            "built_at": time.time(),
+            "alpha": self.alpha,
+            "subjects": self.subjects,
+            "totals": self.totals,
+            "sources": self.sources,
+            "terms": {
+                term: [value for entry in entries for value in entry]
+                for term, entries in self.term_counts.items()
+            },
+        }
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SubjectRouter"]:
+        """Read a saved router, or None if it is missing or from another format"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != ROUTER_FORMAT_VERSION:
+            return None
+
+        term_counts = {
+            term: list(zip(flat[::2], flat[1::2]))
+            for term, flat in data["terms"].items()
+        }
+        sources = {
+            key: tuple(stamp) if stamp else None
+            for key, stamp in data["sources"].items()
+        }
+        return cls(
+            data["subjects"], data["totals"], term_counts, sources, data["alpha"]
+        )
+
+    def get_stats(self) -> Dict:
+        """Get model size"""
+        return {
+            "subjects": len(self.subjects),
+            "terms": len(self.term_counts),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train the subject router from content_library/subjects"
+    )
+    parser.add_argument(
+        "--output", help="router file path (default: in content_library)"
+    )
+    args = parser.parse_args()
+
+    from content_manager import ContentManager
+
+    started = time.perf_counter()
+    manager = ContentManager()
+    router = manager.write_subject_router(args.output)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"🧭 Trained subject router on {len(router.subjects)} subjects, "
+        f"{len(router.term_counts)} terms in {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
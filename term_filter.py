@@ -0,0 +1,54 @@
+import hashlib
+import math
+from typing import Dict, Iterable
+
+
+class TermBloomFilter:
+    """Bloom filter over a document's index terms
+
+    Answers "might this document contain any of these terms?" in a few hashes
+    per term, with no false negatives and about a 1% false-positive rate at
+    the default 10 bits per term. It stays in memory after its shard is
+    evicted, so non-matching shards are never reloaded just to be ruled out.
+    """
+
+    def __init__(self, terms: Iterable[str], bits_per_term: int = 10):
+        terms = list(terms)
+        self.term_count = len(terms)
+        self.size = max(64, self.term_count * bits_per_term)
+        self.hash_count = max(1, round(bits_per_term * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        for term in terms:
+            self.add(term)
+
+    def _positions(self, term: str):
+        # Double hashing from one 128-bit digest (stable across processes)
+        digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * step) % self.size for i in range(self.hash_count)]
+
+    def add(self, term: str):
+        """Add one term"""
+        for position in self._positions(term):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, term: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(term)
+        )
+
+    def might_contain_any(self, terms: Iterable[str]) -> bool:
+        """False only if none of the terms can occur in the document"""
+        return any(term in self for term in terms)
+
+    def get_stats(self) -> Dict:
+        """Get filter size and expected false-positive rate"""
+        fill = 1 - math.exp(-self.hash_count * self.term_count / self.size)
+        return {
+            "terms": self.term_count,
+            "bytes": len(self.bits),
+            "hashes": self.hash_count,
+            "false_positive_rate": round(fill**self.hash_count, 4),
+        }
@@ -0,0 +1,183 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from content_index import BM25_K1, ContentIndex, DocumentIndex
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TermDocumentMatrix:
+    """CSR term x paragraph matrix of precomputed BM25 term weights
+
+    Every stored value is the full per-term BM25 contribution (saturated TF
+    times the document's IDF), so a query's scores are the sum of its term
+    rows: one sparse mat-vec, with results identical to DocumentIndex.search.
+    Columns run over all paragraphs of all documents, so one product scores
+    the whole library.
+    """
+
+    def __init__(self, index: ContentIndex):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for TermDocumentMatrix")
+
+        self.version = index.version
+        self.keys: List[str] = list(index.documents)
+        self.document_versions: Dict[str, int] = {
+            key: document.version for key, document in index.documents.items()
+        }
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+
+        rows: Dict[str, List[Tuple[int, float]]] = {}
+        column_offset = 0
+        for key in self.keys:
+            document = index.documents[key]
+            norms = document.length_norms
+            for term in document.postings:
+                idf = document.idf[term]
+                row = rows.setdefault(term, [])
+                for paragraph_id, count in document.postings[term]:
+                    weight = idf * count * (BM25_K1 + 1) / (count + norms[paragraph_id])
+                    row.append((column_offset + paragraph_id, weight))
+
+            self.ranges[key] = (column_offset, column_offset + len(document))
+            column_offset += len(document)
+
+        self.column_count = column_offset
+        self._starts = np.asarray(
+            [self.ranges[key][0] for key in self.keys], dtype=np.int64
+        )
+        self.term_rows: Dict[str, int] = {}
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for term, entries in rows.items():
+            self.term_rows[term] = len(indptr) - 1
+            for column, weight in entries:
+                indices.append(column)
+                data.append(weight)
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float64)
+
+    def covers(self, documents: Dict[str, DocumentIndex]) -> bool:
+        """Whether every given document is in the matrix at the same version"""
+        return all(
+            self.document_versions.get(key) == document.version
+            for key, document in documents.items()
+        )
+
+    def query_rows(self, query_terms: Iterable[str]) -> List[int]:
+        """Matrix rows for the distinct query terms present in the library"""
+        rows = {self.term_rows.get(term) for term in query_terms}
+        rows.discard(None)
+        return sorted(rows)
+
+    def score(self, query_terms: Iterable[str]) -> "np.ndarray":
+        """Library-wide score vector for one query (binary query vector x matrix)"""
+        scores = np.zeros(self.column_count, dtype=np.float64)
+        for row in self.query_rows(query_terms):
+            start, end = self.indptr[row], self.indptr[row + 1]
+            # Column indices are unique within a row, so plain += is safe
+            scores[self.indices[start:end]] += self.data[start:end]
+        return scores
+
+    def score_batch(self, queries: Sequence[Iterable[str]]) -> "np.ndarray":
+        """Score many queries at once: a (queries x paragraphs) dense result"""
+        query_ids: List["np.ndarray"] = []
+        columns: List["np.ndarray"] = []
+        weights: List["np.ndarray"] = []
+
+        for query_id, terms in enumerate(queries):
+            for row in self.query_rows(terms):
+                start, end = self.indptr[row], self.indptr[row + 1]
+                query_ids.append(np.full(end - start, query_id, dtype=np.int64))
+                columns.append(self.indices[start:end])
+                weights.append(self.data[start:end])
+
+        size = len(queries) * self.column_count
+        if not query_ids:
+            return np.zeros((len(queries), self.column_count), dtype=np.float64)
+
+        flat = np.concatenate(query_ids) * self.column_count + np.concatenate(columns)
+        totals = np.bincount(flat, weights=np.concatenate(weights), minlength=size)
+        return totals.reshape(len(queries), self.column_count)
+
+    def top_k(
+        self, scores: "np.ndarray", keys: Optional[Iterable[str]] = None, k: int = 3
+    ) -> Dict[str, List[Tuple[int, float]]]:
+        """Best k (paragraph id, score) pairs per document, earlier ids on ties
+
+        Only nonzero columns are touched: they are sorted once by (document,
+        score descending, column) and the first k of each document are kept.
+        Documents without any match are left out of the result.
+        """
+        wanted = set(keys) if keys is not None else None
+        results: Dict[str, List[Tuple[int, float]]] = {}
+
+        candidates = np.flatnonzero(scores)
+        if not len(candidates):
+            return results
+
+        documents = np.searchsorted(self._starts, candidates, side="right") - 1
+        values = scores[candidates]
+        order = np.lexsort((candidates, -values, documents))
+        documents, candidates, values = (
+            documents[order],
+            candidates[order],
+            values[order],
+        )
+
+        # Rank of each entry inside its document's run; keep ranks below k
+        positions = np.arange(len(documents))
+        run_starts = np.flatnonzero(np.diff(documents, prepend=-1))
+        run_of = np.searchsorted(run_starts, positions, side="right") - 1
+        keep = positions - run_starts[run_of] < k
+
+        for document, column, score in zip(
+            documents[keep].tolist(),
+            (candidates[keep] - self._starts[documents[keep]]).tolist(),
+            values[keep].tolist(),
+        ):
+            key = self.keys[document]
+            if wanted is None or key in wanted:
+                results.setdefault(key, []).append((column, score))
+        return results
+
+    def search(
+        self,
+        query_terms: Iterable[str],
+        keys: Optional[Iterable[str]] = None,
+        k: int = 3,
+    ) -> Dict[str, List[Tuple[int, float]]]:
+        """Top-k paragraphs per matching document for one query"""
+        return self.top_k(self.score(query_terms), keys, k)
+
+    def search_batch(
+        self,
+        queries: Sequence[Iterable[str]],
+        keys: Optional[Iterable[str]] = None,
+        k: int = 3,
+        chunk_size: int = 64,
+    ) -> List[Dict[str, List[Tuple[int, float]]]]:
+        """Top-k paragraphs per matching document for every query, in chunks"""
+        results = []
+        for start in range(0, len(queries), chunk_size):
+            scores = self.score_batch(queries[start : start + chunk_size])
+            results.extend(self.top_k(row, keys, k) for row in scores)
+        return results
+
+    def get_stats(self) -> Dict:
+        """Get matrix shape and memory use"""
+        return {
+            "terms": len(self.term_rows),
+            "paragraphs": self.column_count,
+            "nonzeros": int(len(self.data)),
+            "bytes": int(self.indptr.nbytes + self.indices.nbytes + self.data.nbytes),
+        }